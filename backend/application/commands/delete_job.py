@@ -10,7 +10,7 @@ from backend.domain.exceptions import EntityNotFoundError, EntityValidationError
 from backend.domain.value_objects.job_status import JobStatus, JobState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeleteJobCommand:
     job_id: str
 
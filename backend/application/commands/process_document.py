@@ -25,7 +25,7 @@ class MappingClient(Protocol):
     def map(self, raw_extractions: List[Dict[str, Any]]) -> List[Dict[str, Any]]: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessDocumentCommand:
     job_id: str
     file_path: str
@@ -344,11 +344,22 @@ class PageExtraction:
             "low_confidence_count": self.low_confidence_count,
         }
     
+    @property
+    def _repr_fields(self) -> dict:
+        """Values shown by __repr__, keyed by their label."""
+        return {
+            "page": self.page_number,
+            "fields": len(self.fields),
+            "tables": len(self.tables),
+            "confidence": self.overall_confidence.value,
+        }
+    
     def __repr__(self) -> str:
         """String representation for debugging."""
+        values = self._repr_fields
         return (
-            f"PageExtraction(page={self.page_number}, "
-            f"fields={len(self.fields)}, "
-            f"tables={len(self.tables)}, "
-            f"confidence={self.overall_confidence.value:.2f})"
+            f"PageExtraction(page={values['page']}, "
+            f"fields={values['fields']}, "
+            f"tables={values['tables']}, "
+            f"confidence={values['confidence']:.2f})"
         )
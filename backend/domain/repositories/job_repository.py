@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from backend.domain.entities.job import Job
+from backend.domain.entities.page_extraction import PageExtraction
+from backend.domain.exceptions import RepositoryError
 
 
 class JobRepository(ABC):
@@ -47,3 +49,25 @@ class JobRepository(ABC):
     @abstractmethod
     def count(self, status: Optional[str] = None) -> int:
         """Return total number of jobs, optionally filtered by status."""
+
+    def save_page_file(self, job_id: str, page: PageExtraction) -> None:
+        """Persist a single page of the job; stores may avoid rewriting the aggregate."""
+        job = self.find_by_id(job_id)
+        if job is None:
+            raise RepositoryError(f"Job {job_id} not found, cannot save page")
+        self.save(job.update_page(page.page_number, page))
+
+    def delete_page_file(self, job_id: str, page_number: int) -> bool:
+        """Remove a single page from the job; return True if it existed."""
+        job = self.find_by_id(job_id)
+        if job is None or job.get_page(page_number) is None:
+            return False
+        self.save(job.remove_page(page_number))
+        return True
+
+    def page_numbers(self, job_id: str) -> Optional[List[int]]:
+        """Return the job's page numbers, or None when the job does not exist."""
+        job = self.find_by_id(job_id)
+        if job is None:
+            return None
+        return [page.page_number for page in job.pages]
@@ -6,11 +6,11 @@ values will be layered on top of this scaffold in subsequent steps.
 """
 from __future__ import annotations
 
-from collections import OrderedDict
 from statistics import mean
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, Iterable, Mapping, MutableMapping, Optional, Sequence, Tuple
 
 from backend.domain.value_objects import (
@@ -85,6 +85,21 @@ LINE_ITEM_HEADER_ALIASES: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=None)
+def _group_labels(group: CanonicalGroup) -> Tuple[str, ...]:
+    """Ordered labels for a group's bundle section, excluding identity members."""
+
+    ordered_fields = sorted(
+        (
+            field
+            for field in CanonicalFieldIndex.for_group(group)
+            if not field.is_identity_block_member and field.include_in_group
+        ),
+        key=lambda f: f.order,
+    )
+    return tuple(field.label for field in ordered_fields)
+
+
 @dataclass(frozen=True)
 class CanonicalSource:
     """Source metadata for a canonical value."""
@@ -295,21 +310,15 @@ class CanonicalMapper:
         normalized = [category.upper() for category in categories]
         return any(any(token in category for token in tokens) for category in normalized)
 
-    def _empty_group(self, group: CanonicalGroup) -> OrderedDict[str, dict]:
+    def _empty_group(self, group: CanonicalGroup) -> Dict[str, dict]:
         """Return ordered mapping of labels to empty canonical value dicts."""
 
-        ordered_fields = sorted(
-            (
-                field
-                for field in CanonicalFieldIndex.for_group(group)
-                if not field.is_identity_block_member and field.include_in_group
-            ),
-            key=lambda f: f.order,
-        )
-        return OrderedDict(
-            (field.label, {"value": None, "confidence": None, "sources": []})
-            for field in ordered_fields
-        )
+        # Labels are static per group; the entry dicts must stay fresh because
+        # map_document fills them in place.
+        return {
+            label: {"value": None, "confidence": None, "sources": []}
+            for label in _group_labels(group)
+        }
 
     def seed_identity_blocks(self) -> list[IdentityBlock]:
         """Provide an empty identity block list preserving ordering metadata."""
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional
@@ -29,11 +30,40 @@ class RenderedPage:
             object.__setattr__(self, "image_path", Path(self.image_path))
 
 
+def _render_document_page(document, index: int, matrix, output_dir: Path) -> RenderedPage:
+    page = document.load_page(index)
+    pixmap = page.get_pixmap(matrix=matrix, alpha=False)
+
+    image_path = output_dir / f"page-{index + 1}.png"
+    pixmap.save(image_path)
+
+    rotation = auto_orient_image(image_path) or 0
+    return RenderedPage(
+        page_number=index + 1,
+        image_path=image_path,
+        image_mime="image/png",
+        rotation_applied=int(rotation),
+    )
+
+
+def _render_page_indices(pdf_path: Path, indices: List[int], zoom: float, output_dir: Path) -> List[RenderedPage]:
+    """Worker entry point: MuPDF documents cannot cross processes, so each opens its own."""
+
+    matrix = fitz.Matrix(zoom, zoom)
+    with fitz.open(pdf_path) as document:
+        return [_render_document_page(document, index, matrix, output_dir) for index in indices]
+
+
 class PdfRenderer:
-    """Renders PDF documents to image files for downstream processing."""
+    """Renders PDF documents to image files for downstream processing.
+
+    With ``max_workers > 1`` pages are rasterised in a process pool; the
+    default stays serial so small documents avoid the pool start-up cost.
+    """
 
-    def __init__(self, *, zoom: float = 3.0) -> None:
+    def __init__(self, *, zoom: float = 3.0, max_workers: int = 1) -> None:
         self._zoom = zoom
+        self._max_workers = max(1, max_workers)
 
     # ------------------------------------------------------------------
     # Public API
@@ -62,28 +92,38 @@ class PdfRenderer:
 
         rendered_pages: List[RenderedPage] = []
 
+        matrix = fitz.Matrix(self._zoom, self._zoom)
         with fitz.open(path) as document:
-            for index in range(document.page_count):
-                page = document.load_page(index)
-                matrix = fitz.Matrix(self._zoom, self._zoom)
-                pixmap = page.get_pixmap(matrix=matrix, alpha=False)
-
-                image_path = output_dir / f"page-{index + 1}.png"
-                pixmap.save(image_path)
-
-                rotation = auto_orient_image(image_path) or 0
-                rendered_pages.append(
-                    RenderedPage(
-                        page_number=index + 1,
-                        image_path=image_path,
-                        image_mime="image/png",
-                        rotation_applied=int(rotation),
-                    )
-                )
+            page_count = document.page_count
+            workers = min(self._max_workers, page_count)
+            if workers <= 1:
+                rendered_pages = [
+                    _render_document_page(document, index, matrix, output_dir)
+                    for index in range(page_count)
+                ]
+
+        if workers > 1:
+            rendered_pages = self._render_parallel(path, page_count, workers, output_dir)
 
         logger.debug("Rendered %s pages for %s", len(rendered_pages), pdf_path)
         return rendered_pages
 
+    def _render_parallel(self, path: Path, page_count: int, workers: int, output_dir: Path) -> List[RenderedPage]:
+        # Strided batches keep the per-worker load even when later pages are
+        # heavier, and each worker parses the PDF only once.
+        batches = [list(range(start, page_count, workers)) for start in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _render_page_indices,
+                [path] * workers,
+                batches,
+                [self._zoom] * workers,
+                [output_dir] * workers,
+            )
+            rendered_pages = [page for batch in results for page in batch]
+        rendered_pages.sort(key=lambda page: page.page_number)
+        return rendered_pages
+
     def render_to_inputs(self, pdf_path: Path | str, output_dir: Optional[Path | str] = None) -> List[dict]:
         """Convenience helper returning dictionaries suitable for the vision client."""
 
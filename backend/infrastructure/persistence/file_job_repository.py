@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from backend.domain.entities.job import Job
 from backend.domain.entities.page_extraction import PageExtraction
@@ -14,15 +19,77 @@ from backend.domain.repositories.job_repository import JobRepository
 from backend.domain.value_objects.job_status import JobState, JobStatus
 from backend.domain.exceptions import RepositoryError
 
+try:  # pragma: no cover - optional dependency guard
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency guard
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
+# (snapshot mtime_ns, snapshot size, pages dir mtime_ns); replacing any page
+# file renames into the pages dir, which bumps that directory's mtime.
+_Stamp = Tuple[int, int, int]
+
+# Upper bound on remembered write digests (roughly one per page file).
+_WRITE_DIGEST_LIMIT = 4096
+
+
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # handle both decoders the same way.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class FileJobRepository(JobRepository):
-    """Persist jobs as JSON snapshots on disk."""
+    """Persist jobs as JSON snapshots on disk.
+
+    ``job_snapshot.json`` holds job metadata and the ordered page numbers;
+    each page lives in its own ``pages/page-{n}.json`` so a page edit only
+    rewrites that page.
+    """
 
-    def __init__(self, base_dir: str = "backend_data") -> None:
+    def __init__(
+        self,
+        base_dir: str = "backend_data",
+        cache_size: int = 256,
+        *,
+        durable: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> None:
         self.base_dir = Path(base_dir)
+        # Threads used to hydrate cache misses in find_all/find_by_status;
+        # defaults to ThreadPoolExecutor's own sizing.
+        self.max_workers = max_workers if max_workers is not None else min(32, (os.cpu_count() or 1) + 4)
+        # When True every write is fsynced (file, then directory) before it
+        # counts as saved; the default only relies on the atomic rename.
+        self.durable = durable
         self.snapshot_filename = "job_snapshot.json"
+        self.pages_dirname = "pages"
+        self.cache_size = cache_size
+        # Jobs are frozen, so hydrated aggregates can be handed out repeatedly
+        # until their files change on disk.
+        self._cache: "OrderedDict[str, Tuple[_Stamp, Job]]" = OrderedDict()
+        # job_id -> (stamp, state value, created_at) for jobs that hydrated
+        # cleanly; lets status queries skip re-hydrating jobs that cannot
+        # match. Entries are tiny, so it is not bounded, and the stamp check
+        # catches snapshots rewritten elsewhere.
+        self._status_index: Dict[str, Tuple[_Stamp, str, datetime]] = {}
+        # job_id -> stamp at which hydration failed; status queries leave
+        # these out so count agrees with the listings that skip them.
+        self._unreadable: Dict[str, _Stamp] = {}
+        # Job ids whose pages directory this instance has already created.
+        self._known_dirs: set[str] = set()
+        # path -> (payload digest, (mtime_ns, size) after our write); lets
+        # save skip files whose content would not change.
+        self._write_digests: "OrderedDict[str, Tuple[bytes, Tuple[int, int]]]" = OrderedDict()
         self._ensure_base_dir()
 
     # ------------------------------------------------------------------
@@ -30,35 +97,77 @@ class FileJobRepository(JobRepository):
     # ------------------------------------------------------------------
     def save(self, job: Job) -> None:
         snapshot = self._job_to_snapshot(job)
-        job_dir = self._job_dir(job.job_id)
-        try:
-            job_dir.mkdir(parents=True, exist_ok=True)
-        except OSError as exc:  # pragma: no cover - disk failure
-            raise RepositoryError(f"Failed to create directory for job {job.job_id}", exc)
+        self._forget(job.job_id)
+        self._make_job_dir(job.job_id)
+        for page in job.pages:
+            self._write_page(job.job_id, page)
+        self._remove_stale_pages(job.job_id, {page.page_number for page in job.pages})
+        self._write_json(self._snapshot_path(job.job_id), snapshot, f"Failed to save job {job.job_id}")
+        logger.debug("Saved job %s", job.job_id)
+
+    def save_page_file(self, job_id: str, page: PageExtraction) -> None:
+        """Persist a single page without rewriting the other pages of the job.
+
+        Only ``pages/page-{n}.json`` and the metadata-only snapshot are
+        written; the snapshot is refreshed so ``updated_at`` reflects the edit.
+        """
+        snapshot = self._load_snapshot(job_id)
+        if snapshot is None:
+            raise RepositoryError(f"Job {job_id} not found, cannot save page")
+
+        self._forget(job_id)
+        self._write_page(job_id, page)
+
+        entries = list(snapshot.get("pages", []))
+        page_numbers = [self._page_number_of(entry) for entry in entries]
+        if page.page_number in page_numbers:
+            # Snapshots from older writers embed pages; point the entry at
+            # the page file so the inline copy no longer shadows it.
+            entries[page_numbers.index(page.page_number)] = page.page_number
+        else:
+            entries.append(page.page_number)
+        self._write_page_index(job_id, snapshot, entries)
 
-        snapshot_path = self._snapshot_path(job.job_id)
-        tmp_path = snapshot_path.with_suffix(".tmp")
+    def delete_page_file(self, job_id: str, page_number: int) -> bool:
+        """Remove one page from a job without hydrating or rewriting the others."""
+        snapshot = self._load_snapshot(job_id)
+        if snapshot is None:
+            return False
 
-        try:
-            tmp_path.write_text(json.dumps(snapshot, indent=2), encoding="utf-8")
-            tmp_path.replace(snapshot_path)
-            logger.debug("Saved job %s", job.job_id)
-        except (OSError, TypeError, ValueError) as exc:
-            if tmp_path.exists():
-                tmp_path.unlink(missing_ok=True)
-            raise RepositoryError(f"Failed to save job {job.job_id}", exc)
-        finally:
-            if tmp_path.exists():
-                tmp_path.unlink(missing_ok=True)
+        entries = list(snapshot.get("pages", []))
+        remaining = [entry for entry in entries if self._page_number_of(entry) != page_number]
+        if len(remaining) == len(entries):
+            return False
+
+        self._forget(job_id)
+        # Unlink after the snapshot stops listing the page: a crash in between
+        # leaves an orphan file that the next full save clears.
+        self._write_page_index(job_id, snapshot, remaining)
+        self._page_path(job_id, page_number).unlink(missing_ok=True)
+        return True
+
+    def page_numbers(self, job_id: str) -> Optional[List[int]]:
+        """Return the job's page numbers from its snapshot, or None if missing."""
+        snapshot = self._load_snapshot(job_id)
+        if snapshot is None:
+            return None
+        return [self._page_number_of(entry) for entry in snapshot.get("pages", [])]
 
     def find_by_id(self, job_id: str) -> Optional[Job]:
+        stamp = self._stamp(job_id)
+        cached = self._cached_job(job_id, stamp)
+        if cached is not None:
+            return cached
         data = self._load_snapshot(job_id)
         if data is None:
             return None
         try:
-            return self._snapshot_to_job(data)
+            job = self._snapshot_to_job(data)
         except Exception as exc:  # pragma: no cover - unexpected snapshot structure
+            self._mark_unreadable(job_id, stamp)
             raise RepositoryError(f"Failed to hydrate job {job_id}", exc)
+        self._remember(job_id, stamp, job)
+        return job
 
     def find_all(
         self,
@@ -66,19 +175,7 @@ class FileJobRepository(JobRepository):
         offset: int = 0,
         sort_desc: bool = True,
     ) -> List[Job]:
-        jobs: List[Job] = []
-        for job_dir in self.base_dir.iterdir():
-            if not job_dir.is_dir():
-                continue
-            data = self._load_snapshot(job_dir.name)
-            if data is None:
-                continue
-            try:
-                jobs.append(self._snapshot_to_job(data))
-            except Exception as exc:
-                logger.warning("Skipping job %s due to snapshot error: %s", job_dir.name, exc)
-                continue
-
+        jobs = self._load_jobs(list(self._job_ids()))
         jobs.sort(key=lambda job: job.created_at, reverse=sort_desc)
 
         start = offset
@@ -92,14 +189,15 @@ class FileJobRepository(JobRepository):
         offset: int = 0,
         sort_desc: bool = True,
     ) -> List[Job]:
-        status_lower = status.lower()
-        filtered = [job for job in self.find_all() if job.status.state.value == status_lower]
-        filtered.sort(key=lambda job: job.created_at, reverse=sort_desc)
+        matches = self._status_matches(status)
+        matches.sort(key=lambda match: match[1], reverse=sort_desc)
         start = offset
         end = None if limit is None else offset + limit
-        return filtered[start:end]
+        return self._load_jobs([job_id for job_id, _ in matches[start:end]])
 
     def delete(self, job_id: str) -> bool:
+        self._forget(job_id)
+        self._known_dirs.discard(job_id)
         job_dir = self._job_dir(job_id)
         if not job_dir.exists():
             return False
@@ -116,14 +214,14 @@ class FileJobRepository(JobRepository):
         return self._snapshot_path(job_id).exists()
 
     def count(self, status: Optional[str] = None) -> int:
+        """Return the number of jobs, optionally filtered by status.
+
+        Status counts leave out jobs that fail to hydrate, matching
+        ``find_by_status``.
+        """
         if status is None:
-            return sum(1 for job_dir in self.base_dir.iterdir() if self._snapshot_path(job_dir.name).exists())
-        status_lower = status.lower()
-        return sum(
-            1
-            for job in self.find_all()
-            if job.status.state.value == status_lower
-        )
+            return sum(1 for job_id in self._job_ids() if self._snapshot_path(job_id).exists())
+        return len(self._status_matches(status))
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -140,16 +238,257 @@ class FileJobRepository(JobRepository):
     def _snapshot_path(self, job_id: str) -> Path:
         return self._job_dir(job_id) / self.snapshot_filename
 
-    def _load_snapshot(self, job_id: str) -> Optional[dict]:
-        snapshot_path = self._snapshot_path(job_id)
-        if not snapshot_path.exists():
+    def _job_ids(self) -> Iterator[str]:
+        # scandir's DirEntry answers is_dir from the directory listing itself,
+        # where Path.iterdir + is_dir costs an extra stat per job.
+        with os.scandir(self.base_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield entry.name
+
+    def _load_jobs(self, job_ids: List[str]) -> List[Job]:
+        """Return the jobs for ``job_ids`` in order, skipping unreadable ones.
+
+        Cache misses are hydrated on a thread pool: file reads release the
+        GIL, so a cold listing is bound by parsing rather than read latency.
+        Cache bookkeeping stays on the calling thread.
+        """
+        jobs: List[Optional[Job]] = []
+        misses: List[Tuple[int, str, Optional[_Stamp]]] = []
+        for job_id in job_ids:
+            stamp = self._stamp(job_id)
+            cached = self._cached_job(job_id, stamp)
+            if cached is None:
+                misses.append((len(jobs), job_id, stamp))
+            jobs.append(cached)
+
+        if misses:
+            miss_ids = [job_id for _, job_id, _ in misses]
+            workers = min(self.max_workers, len(miss_ids))
+            if workers > 1 and len(miss_ids) > 4:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    loaded = list(executor.map(self._hydrate_or_skip, miss_ids))
+            else:
+                loaded = [self._hydrate_or_skip(job_id) for job_id in miss_ids]
+            for (index, job_id, stamp), job in zip(misses, loaded):
+                if job is None:
+                    self._mark_unreadable(job_id, stamp)
+                else:
+                    self._remember(job_id, stamp, job)
+                    jobs[index] = job
+
+        return [job for job in jobs if job is not None]
+
+    def _hydrate_or_skip(self, job_id: str) -> Optional[Job]:
+        data = self._load_snapshot(job_id)
+        if data is None:
             return None
         try:
-            return json.loads(snapshot_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            raise RepositoryError(f"Corrupted snapshot for job {job_id}", exc)
+            return self._snapshot_to_job(data)
+        except Exception as exc:
+            logger.warning("Skipping job %s due to snapshot error: %s", job_id, exc)
+            return None
+
+    def _status_matches(self, status: str) -> List[Tuple[str, datetime]]:
+        """Return ``(job_id, created_at)`` for readable jobs in ``status``, unordered.
+
+        Jobs changed since they were last indexed are hydrated (in parallel,
+        through ``_load_jobs``) so the index only lists jobs the listings can
+        return; unchanged jobs are answered from the index alone.
+        """
+        status_lower = status.lower()
+        stale: List[str] = []
+        current: List[Tuple[str, _Stamp]] = []
+        for job_id in self._job_ids():
+            stamp = self._stamp(job_id)
+            if stamp is None:
+                self._status_index.pop(job_id, None)
+                continue
+            current.append((job_id, stamp))
+            entry = self._status_index.get(job_id)
+            if (entry is None or entry[0] != stamp) and self._unreadable.get(job_id) != stamp:
+                stale.append(job_id)
+        if stale:
+            self._load_jobs(stale)
+
+        matches: List[Tuple[str, datetime]] = []
+        for job_id, stamp in current:
+            entry = self._status_index.get(job_id)
+            if entry is not None and entry[1] == status_lower:
+                matches.append((job_id, entry[2]))
+        return matches
+
+    def _forget(self, job_id: str) -> None:
+        self._cache.pop(job_id, None)
+        self._status_index.pop(job_id, None)
+        self._unreadable.pop(job_id, None)
+
+    def _mark_unreadable(self, job_id: str, stamp: Optional[_Stamp]) -> None:
+        self._status_index.pop(job_id, None)
+        if stamp is not None:
+            self._unreadable[job_id] = stamp
+
+    def _stamp(self, job_id: str) -> Optional[_Stamp]:
+        try:
+            snapshot_stat = self._snapshot_path(job_id).stat()
+        except FileNotFoundError:
+            return None
+        try:
+            pages_mtime = self._pages_dir(job_id).stat().st_mtime_ns
+        except FileNotFoundError:
+            pages_mtime = 0
+        return (snapshot_stat.st_mtime_ns, snapshot_stat.st_size, pages_mtime)
+
+    def _cached_job(self, job_id: str, stamp: Optional[_Stamp]) -> Optional[Job]:
+        entry = self._cache.get(job_id)
+        if entry is None:
+            return None
+        if stamp is None or entry[0] != stamp:
+            del self._cache[job_id]
+            return None
+        self._cache.move_to_end(job_id)
+        return entry[1]
+
+    def _remember(self, job_id: str, stamp: Optional[_Stamp], job: Job) -> None:
+        if stamp is None:
+            return
+        self._unreadable.pop(job_id, None)
+        self._status_index[job_id] = (stamp, job.status.state.value, job.created_at)
+        if self.cache_size <= 0:
+            return
+        self._cache[job_id] = (stamp, job)
+        self._cache.move_to_end(job_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _pages_dir(self, job_id: str) -> Path:
+        return self._job_dir(job_id) / self.pages_dirname
+
+    def _page_path(self, job_id: str, page_number: int) -> Path:
+        return self._pages_dir(job_id) / f"page-{page_number}.json"
+
+    def _make_job_dir(self, job_id: str) -> None:
+        if job_id in self._known_dirs:
+            return
+        try:
+            self._pages_dir(job_id).mkdir(parents=True, exist_ok=True)
+        except OSError as exc:  # pragma: no cover - disk failure
+            raise RepositoryError(f"Failed to create directory for job {job_id}", exc)
+        self._known_dirs.add(job_id)
+
+    def _write_json(self, path: Path, payload: Any, error_message: str) -> None:
+        # Unique per process and thread so concurrent saves of the same job
+        # never write through one shared temp file.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            data = _dumps(payload)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if self._unchanged_on_disk(path, digest):
+                return
+            try:
+                self._write_file(tmp_path, data)
+            except FileNotFoundError:
+                # The directory was removed outside this repository after
+                # _known_dirs recorded it; recreate it and retry once.
+                path.parent.mkdir(parents=True, exist_ok=True)
+                self._write_file(tmp_path, data)
+            os.replace(tmp_path, path)
+            if self.durable:
+                self._fsync_dir(path.parent)
+            self._record_write(path, digest)
+        except (OSError, TypeError, ValueError) as exc:
+            tmp_path.unlink(missing_ok=True)
+            raise RepositoryError(error_message, exc)
+
+    def _unchanged_on_disk(self, path: Path, digest: bytes) -> bool:
+        # The stat check guards against the file having been replaced or
+        # removed by anything other than our own last write.
+        entry = self._write_digests.get(str(path))
+        if entry is None or entry[0] != digest:
+            return False
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) == entry[1]
+
+    def _record_write(self, path: Path, digest: bytes) -> None:
+        stat = path.stat()
+        key = str(path)
+        self._write_digests[key] = (digest, (stat.st_mtime_ns, stat.st_size))
+        self._write_digests.move_to_end(key)
+        while len(self._write_digests) > _WRITE_DIGEST_LIMIT:
+            self._write_digests.popitem(last=False)
+
+    def _write_file(self, path: Path, data: bytes) -> None:
+        with open(path, "wb") as handle:
+            handle.write(data)
+            if self.durable:
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        if not hasattr(os, "O_DIRECTORY"):  # pragma: no cover - Windows cannot open directories
+            return
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _write_page_index(self, job_id: str, snapshot: dict, entries: list) -> None:
+        snapshot["pages"] = entries
+        snapshot["processed_pages"] = len(entries)
+        snapshot["updated_at"] = datetime.now().isoformat()
+        self._write_json(self._snapshot_path(job_id), snapshot, f"Failed to save job {job_id}")
+
+    def _write_page(self, job_id: str, page: PageExtraction) -> None:
+        self._make_job_dir(job_id)
+        self._write_json(
+            self._page_path(job_id, page.page_number),
+            page.to_dict(),
+            f"Failed to save page {page.page_number} of job {job_id}",
+        )
+
+    def _remove_stale_pages(self, job_id: str, keep: set[int]) -> None:
+        for page_path in self._pages_dir(job_id).glob("page-*.json"):
+            try:
+                page_number = int(page_path.stem.split("-", 1)[1])
+            except ValueError:
+                continue
+            if page_number not in keep:
+                page_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _page_number_of(entry: Any) -> Any:
+        if isinstance(entry, dict):
+            return entry.get("page_number") or entry.get("pageNumber") or entry.get("page")
+        return entry
+
+    def _load_snapshot(self, job_id: str) -> Optional[dict]:
+        return self._read_json(self._snapshot_path(job_id), f"snapshot for job {job_id}")
+
+    def _load_page_file(self, job_id: str, page_number: int) -> Optional[dict]:
+        return self._read_json(
+            self._page_path(job_id, page_number),
+            f"page {page_number} for job {job_id}",
+        )
+
+    @staticmethod
+    def _read_json(path: Path, label: str) -> Optional[dict]:
+        # Both decoders take raw bytes, so there is no need for read_text to
+        # build an intermediate str first.
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return None
         except OSError as exc:  # pragma: no cover - disk failure
-            raise RepositoryError(f"Failed to read snapshot for job {job_id}", exc)
+            raise RepositoryError(f"Failed to read {label}", exc)
+        try:
+            return _loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise RepositoryError(f"Corrupted {label}", exc)
 
     # Snapshot -> Domain ------------------------------------------------
     def _snapshot_to_job(self, data: dict) -> Job:
@@ -177,11 +516,7 @@ class FileJobRepository(JobRepository):
             or status_total_pages
         )
 
-        created_at = self._parse_datetime(
-            data.get("created_at")
-            or data.get("createdAt")
-            or data.get("status", {}).get("startedAt")
-        )
+        created_at = self._snapshot_created_at(data)
         updated_at = self._parse_datetime(
             data.get("updated_at")
             or data.get("updatedAt")
@@ -196,6 +531,10 @@ class FileJobRepository(JobRepository):
             if isinstance(page_entry, dict):
                 pages.append(self._snapshot_to_page(job_id, page_entry))
             elif isinstance(page_entry, (int, float)):
+                page_data = self._load_page_file(job_id, int(page_entry))
+                if page_data is not None:
+                    pages.append(self._snapshot_to_page(job_id, page_data))
+                    continue
                 try:
                     pages.append(PageExtraction.create(page_number=int(page_entry)))
                 except ValueError:
@@ -216,6 +555,13 @@ class FileJobRepository(JobRepository):
             source_path=source_path,
         )
 
+    def _snapshot_created_at(self, data: dict) -> Optional[datetime]:
+        return self._parse_datetime(
+            data.get("created_at")
+            or data.get("createdAt")
+            or data.get("status", {}).get("startedAt")
+        )
+
     def _snapshot_to_page(self, job_id: str, data: dict) -> PageExtraction:
         if isinstance(data, PageExtraction):
             return data
@@ -352,37 +698,29 @@ class FileJobRepository(JobRepository):
                     )
                 )
 
-            for row_index, row in enumerate(data["rows"]):
-                if isinstance(row, dict):
-                    keys = column_keys or list(row.keys())
-                    for col_index, key in enumerate(keys):
+            create_cell = self._create_table_cell_entry
+            # Lower-cased fallbacks are derived once per table, not per cell.
+            lowered_keys = tuple(
+                key.lower() if isinstance(key, str) else key for key in column_keys
+            )
+            for row_index, row in enumerate(data["rows"], start=header_row_offset):
+                if isinstance(row, list):
+                    normalized_cells.extend(
+                        create_cell(row_index, col_index, value)
+                        for col_index, value in enumerate(row)
+                    )
+                elif isinstance(row, dict):
+                    if column_keys:
+                        key_pairs = zip(column_keys, lowered_keys)
+                    else:
+                        key_pairs = ((key, key.lower() if isinstance(key, str) else key) for key in list(row))
+                    for col_index, (key, lowered) in enumerate(key_pairs):
                         cell_payload = row.get(key)
                         if cell_payload is None and isinstance(key, str):
-                            cell_payload = row.get(key.lower())
-                        normalized_cells.append(
-                            self._create_table_cell_entry(
-                                header_row_offset + row_index,
-                                col_index,
-                                cell_payload,
-                            )
-                        )
-                elif isinstance(row, list):
-                    for col_index, value in enumerate(row):
-                        normalized_cells.append(
-                            self._create_table_cell_entry(
-                                header_row_offset + row_index,
-                                col_index,
-                                value,
-                            )
-                        )
+                            cell_payload = row.get(lowered)
+                        normalized_cells.append(create_cell(row_index, col_index, cell_payload))
                 else:
-                    normalized_cells.append(
-                        self._create_table_cell_entry(
-                            header_row_offset + row_index,
-                            0,
-                            row,
-                        )
-                    )
+                    normalized_cells.append(create_cell(row_index, 0, row))
 
         return {
             "id": data.get("id"),
@@ -396,6 +734,18 @@ class FileJobRepository(JobRepository):
         }
 
     def _create_table_cell_entry(self, row: int, column: int, payload: Any) -> dict:
+        if isinstance(payload, str):
+            # Plain string cells are the bulk of list-shaped rows.
+            return {
+                "row": row,
+                "column": column,
+                "content": payload,
+                "rowspan": 1,
+                "colspan": 1,
+                "is_header": False,
+                "bounding_box": None,
+            }
+
         cell_value = payload
         cell_confidence = None
         bbox = None
@@ -509,7 +859,7 @@ class FileJobRepository(JobRepository):
             "error_message": job.status.error_message,
             "total_pages": job.total_pages,
             "processed_pages": len(job.pages),
-            "pages": [page.to_dict() for page in job.pages],
+            "pages": [page.page_number for page in job.pages],
             "created_at": job.created_at.isoformat(),
             "updated_at": job.updated_at.isoformat(),
             "source_path": job.source_path,
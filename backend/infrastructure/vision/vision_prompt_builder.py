@@ -34,6 +34,12 @@ DEFAULT_PROMPT_TEMPLATE = (
     "Do not add commentary. If nothing is found return {\"documentType\":{\"label\":\"other\",\"confidence\":0.0,\"reasons\":[]},\"fields\":[],\"tables\":[]}."
 )
 
+_PAGE_USER_TEXT = "Perform OCR to extract field-value pair data and table data for page {page_number}."
+_RELAXED_USER_TEXT = (
+    "Perform OCR to extract field-value pair data and table data for this page."
+    " If no structured data can be extracted, reply with an empty fields/tables array."
+)
+
 
 @dataclass(frozen=True)
 class VisionPromptAttempt:
@@ -51,33 +57,29 @@ def build_prompt_attempts(page_number: int, image_data_url: str) -> List[VisionP
     formatting, and finally with a clarifying instruction.
     """
 
+    system_message = {"role": "system", "content": DEFAULT_PROMPT_TEMPLATE}
+    # Attempts share the system message and image part instead of each
+    # building its own wrapper dicts.
+    image_part = {"type": "image_url", "image_url": {"url": image_data_url}}
+
     base_messages = [
-        {"role": "system", "content": DEFAULT_PROMPT_TEMPLATE},
+        system_message,
         {
             "role": "user",
             "content": [
-                {
-                    "type": "text",
-                    "text": f"Perform OCR to extract field-value pair data and table data for page {page_number}.",
-                },
-                {"type": "image_url", "image_url": {"url": image_data_url}},
+                {"type": "text", "text": _PAGE_USER_TEXT.format(page_number=page_number)},
+                image_part,
             ],
         },
     ]
 
     relaxed_messages = [
-        base_messages[0],
+        system_message,
         {
             "role": "user",
             "content": [
-                {
-                    "type": "text",
-                    "text": (
-                        "Perform OCR to extract field-value pair data and table data for this page."
-                        " If no structured data can be extracted, reply with an empty fields/tables array."
-                    ),
-                },
-                {"type": "image_url", "image_url": {"url": image_data_url}},
+                {"type": "text", "text": _RELAXED_USER_TEXT},
+                image_part,
             ],
         },
     ]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional
 
 from backend.constants import CONFIDENCE_STEPS
@@ -38,24 +39,17 @@ class VisionResponseParser:
         fields = tuple(self._parse_fields(page_number, payload.get("fields") or [], source=source))
         tables = tuple(self._parse_tables(page_number, payload.get("tables") or [], source=source))
 
-        page = PageExtraction.create(
+        # Build the page directly; a to_dict/from_dict round trip would
+        # rebuild every field, cell and shared Confidence just to set metadata.
+        return PageExtraction.create(
             page_number=page_number,
             fields=list(fields),
             tables=list(tables),
             image_path=image_path,
+            document_type_hint=metadata.document_type_label or None,
+            document_type_confidence=metadata.document_type_confidence,
         )
 
-        # Attach metadata if present by updating the dict representation.
-        page_dict = page.to_dict()
-        if metadata.document_type_label:
-            page_dict["document_type_hint"] = metadata.document_type_label
-        if metadata.document_type_confidence is not None:
-            page_dict["document_type_confidence"] = metadata.document_type_confidence
-        if metadata.document_type_reasons:
-            page_dict["document_type_reasons"] = metadata.document_type_reasons
-
-        return PageExtraction.from_dict(page_dict)
-
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -123,15 +117,21 @@ class VisionResponseParser:
             rows = item.get("rows") or []
             columns = self._normalize_columns(item.get("columns"))
             cells: List[TableCell] = []
+            parse_cell = self._parse_cell
+            # Lower-cased fallbacks are derived once per table, not per cell.
+            column_pairs = [(key, key.lower()) for key in columns]
 
             for row_index, row_payload in enumerate(rows):
                 if isinstance(row_payload, list):
-                    for column_index, cell_payload in enumerate(row_payload):
-                        cells.append(self._parse_cell(row_index, column_index, cell_payload))
+                    cells.extend(
+                        parse_cell(row_index, column_index, cell_payload)
+                        for column_index, cell_payload in enumerate(row_payload)
+                    )
                 elif isinstance(row_payload, dict):
-                    for column_index, column_key in enumerate(columns):
-                        cell_payload = row_payload.get(column_key, row_payload.get(column_key.lower()))
-                        cells.append(self._parse_cell(row_index, column_index, cell_payload))
+                    cells.extend(
+                        parse_cell(row_index, column_index, row_payload.get(key, row_payload.get(lowered)))
+                        for column_index, (key, lowered) in enumerate(column_pairs)
+                    )
                 elif row_payload is None:
                     continue
                 else:
@@ -140,7 +140,7 @@ class VisionResponseParser:
                             row=row_index,
                             column=0,
                             content=_safe_str(row_payload),
-                            confidence=Confidence(confidence),
+                            confidence=_confidence(confidence),
                         )
                     )
 
@@ -165,7 +165,7 @@ class VisionResponseParser:
                 row=row,
                 column=column,
                 content=_safe_str(value),
-                confidence=Confidence(confidence) if confidence is not None else None,
+                confidence=_confidence(confidence) if confidence is not None else None,
                 bounding_box=bbox,
             )
 
@@ -222,6 +222,13 @@ def _parse_bbox(data: Any) -> Optional[BoundingBox]:
         return None
 
 
+@lru_cache(maxsize=None)
+def _confidence(step: float) -> Confidence:
+    # Quantized scores only take CONFIDENCE_STEPS values, so every cell on a
+    # page can share one immutable Confidence per step.
+    return Confidence(step)
+
+
 def _quantize_confidence(value: Optional[float]) -> Optional[float]:
     if value is None:
         return None
@@ -22,7 +22,12 @@ from ...models.job import (
 from .aggregation import aggregate_fields
 from .store import job_store
 from ...constants import SNAPSHOT_VERSION
-from ...repositories.snapshot_repository import save_snapshot_payload, load_snapshot as load_snapshot_repo, list_snapshot_raw
+from ...repositories.snapshot_repository import (
+  save_snapshot_payload,
+  load_snapshot as load_snapshot_repo,
+  list_snapshot_raw,
+  resolve_page_entries,
+)
 from ...config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -311,7 +316,7 @@ def get_low_confidence_fields(limit: int = 50, job_id: Optional[str] = None) ->
     if not snapshot_path.exists():
       continue
     try:
-      data = json.loads(snapshot_path.read_text(encoding="utf-8"))
+      data = resolve_page_entries(json.loads(snapshot_path.read_text(encoding="utf-8")), job_dir)
       document_name = data.get("documentName", "Unknown")
       pages = data.get("pages", [])
       for page in pages:
@@ -461,7 +466,7 @@ def get_job_detail(job_id: str) -> Optional[Dict[str, Any]]:
   if not snapshot_path.exists():
     return None
   try:
-    data = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    data = resolve_page_entries(json.loads(snapshot_path.read_text(encoding="utf-8")), _job_dir(job_id))
     summary = data.get("summary") or _job_summary_from_snapshot(data)
     return {
       "jobId": data.get("jobId", job_id),
@@ -9,6 +9,7 @@ logger = logging.getLogger(__name__)
 
 BASE_STORAGE_DIR = Path("backend_data")
 SNAPSHOT_FILENAME = "job_snapshot.json"
+PAGES_DIRNAME = "pages"
 
 
 def _ensure_storage_dir() -> None:
@@ -23,6 +24,36 @@ def _snapshot_path(job_id: str) -> Path:
   return _job_dir(job_id) / SNAPSHOT_FILENAME
 
 
+def resolve_page_entries(data: Dict[str, Any], job_dir: Path) -> Dict[str, Any]:
+  """Replace page-number entries in ``data["pages"]`` with their page dicts.
+
+  FileJobRepository stores pages in ``pages/page-{n}.json`` and lists only
+  their numbers in the snapshot, while legacy writers embed page dicts; a
+  snapshot may mix both. Entries whose page file is missing or unreadable
+  are dropped.
+  """
+  pages = data.get("pages")
+  if not isinstance(pages, list) or all(isinstance(entry, dict) for entry in pages):
+    return data
+  resolved: List[Dict[str, Any]] = []
+  for entry in pages:
+    if isinstance(entry, dict):
+      resolved.append(entry)
+      continue
+    if not isinstance(entry, (int, float)):
+      continue
+    page_path = job_dir / PAGES_DIRNAME / f"page-{int(entry)}.json"
+    try:
+      page_data = json.loads(page_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+      logger.debug("Skipping page file %s: %s", page_path, exc)
+      continue
+    if isinstance(page_data, dict):
+      resolved.append(page_data)
+  data["pages"] = resolved
+  return data
+
+
 def save_snapshot_payload(job_id: str, payload: Dict[str, Any]) -> None:
   """Persist a prepared snapshot payload to disk."""
   try:
@@ -41,7 +72,7 @@ def load_snapshot(job_id: str) -> Optional[Dict[str, Any]]:
     return None
   try:
     data = json.loads(snapshot_path.read_text(encoding="utf-8"))
-    return data
+    return resolve_page_entries(data, _job_dir(job_id))
   except json.JSONDecodeError as exc:
     logger.error("Snapshot %s invalid JSON: %s", job_id, exc)
     return None
@@ -58,7 +89,7 @@ def list_snapshot_raw() -> List[Dict[str, Any]]:
       continue
     try:
       data = json.loads(snapshot_path.read_text(encoding="utf-8"))
-      results.append(data)
+      results.append(resolve_page_entries(data, job_dir))
     except Exception as exc:  # pragma: no cover
       logger.debug("Skipping snapshot %s due to error: %s", snapshot_path, exc)
   return results
@@ -30,3 +30,11 @@ for alias, module_name in {
 }.items():
     if alias not in sys.modules:
         sys.modules[alias] = importlib.import_module(module_name)
+
+
+def pytest_configure(config):
+    """Register custom markers (there is no ini file to declare them in)."""
+    config.addinivalue_line(
+        "markers",
+        "serialization: to_dict/from_dict roundtrip tests; deselect with -m 'not serialization'",
+    )
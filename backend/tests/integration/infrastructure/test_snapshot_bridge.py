@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
+from backend.domain.entities.job import Job
+from backend.domain.entities.page_extraction import PageExtraction as DomainPageExtraction
 from backend.domain.value_objects.job_status import JobState
 from backend.infrastructure.persistence.file_job_repository import FileJobRepository
 from backend.legacy.services import history_service, job_runner
@@ -119,4 +122,53 @@ def test_legacy_job_processing_updates_snapshot_for_domain_repo(tmp_path, monkey
     assert hydrated.pages[0].has_fields
     assert hydrated.pages[0].fields[0].field_name == "total_amount"
 
-    job_store._jobs.clear()
\ No newline at end of file
+    job_store._jobs.clear()
+
+def test_domain_repository_snapshot_is_readable_by_legacy_history(tmp_path, monkeypatch) -> None:
+    """Ensure snapshots written with per-page files still load through the legacy history service."""
+    storage_dir = tmp_path / "snapshots"
+    monkeypatch.setattr(history_service, "BASE_STORAGE_DIR", storage_dir)
+    monkeypatch.setattr(snapshot_repository, "BASE_STORAGE_DIR", storage_dir)
+
+    repository = FileJobRepository(base_dir=str(storage_dir))
+    job = Job.create(job_id="domain-job", filename="domain.pdf").with_pages(
+        [DomainPageExtraction.create(page_number=1)]
+    )
+    repository.save(job)
+
+    loaded = history_service.load_job_from_snapshot("domain-job")
+    assert loaded is not None
+    assert [page.page_number for page in loaded.pages] == [1]
+
+    snapshot = snapshot_repository.load_snapshot("domain-job")
+    assert snapshot is not None
+    assert [page["page_number"] for page in snapshot["pages"]] == [1]
+    assert history_service.get_low_confidence_fields(job_id="domain-job") == []
+
+
+def test_page_edit_on_embedded_snapshot_stays_readable_by_legacy_history(tmp_path, monkeypatch) -> None:
+    """Ensure a partially migrated page list (dicts and page numbers) still loads every page."""
+    storage_dir = tmp_path / "snapshots"
+    monkeypatch.setattr(history_service, "BASE_STORAGE_DIR", storage_dir)
+    monkeypatch.setattr(snapshot_repository, "BASE_STORAGE_DIR", storage_dir)
+
+    repository = FileJobRepository(base_dir=str(storage_dir))
+    job = Job.create(job_id="embedded-job", filename="embedded.pdf").with_pages(
+        [DomainPageExtraction.create(page_number=1), DomainPageExtraction.create(page_number=2)]
+    )
+    snapshot = {
+        "job_id": job.job_id,
+        "filename": job.filename,
+        "status": job.status.state.value,
+        "created_at": job.created_at.isoformat(),
+        "pages": [page.to_dict() for page in job.pages],
+    }
+    job_dir = storage_dir / "embedded-job"
+    job_dir.mkdir(parents=True)
+    (job_dir / "job_snapshot.json").write_text(json.dumps(snapshot), encoding="utf-8")
+
+    repository.save_page_file("embedded-job", DomainPageExtraction.create(page_number=2).mark_reviewed())
+
+    loaded = history_service.load_job_from_snapshot("embedded-job")
+    assert loaded is not None
+    assert [page.page_number for page in loaded.pages] == [1, 2]
@@ -0,0 +1,97 @@
+"""Shared fixtures for command handler unit tests."""
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from backend.domain.entities.job import Job
+
+
+@pytest.fixture
+def mock_job_repository():
+    """Mock job repository (fresh per test so call history stays isolated)."""
+    repo = Mock()
+    repo.find_by_id = Mock(return_value=None)
+    repo.save = Mock(return_value=None)
+    repo.delete = Mock(return_value=None)
+    return repo
+
+
+@pytest.fixture
+def tiny_job_repository():
+    """Factory for a plain job repository stub that records calls.
+
+    Cheaper than ``Mock`` for tests that only need ``find_by_id``/``delete``
+    and simple call assertions; recorded arguments live in ``calls``.
+    """
+    def _make(find_return=None):
+        calls = {"find_by_id": [], "delete": []}
+
+        def find_by_id(job_id):
+            calls["find_by_id"].append(job_id)
+            return find_return
+
+        def delete(job_id):
+            calls["delete"].append(job_id)
+
+        return SimpleNamespace(find_by_id=find_by_id, delete=delete, calls=calls)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def sample_job():
+    """Sample job entity."""
+    return Job.create(
+        job_id="test_job_123",
+        filename="test.pdf",
+        source_path="/tmp/test.pdf",
+        total_pages=2
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_job_pending():
+    """Sample pending job entity."""
+    return Job.create(
+        job_id="test_job_123",
+        filename="test.pdf",
+        source_path="/tmp/test.pdf",
+        total_pages=3
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_job_completed():
+    """Sample completed job entity."""
+    job = Job.create(
+        job_id="completed_job_456",
+        filename="completed.pdf",
+        source_path="/tmp/completed.pdf",
+        total_pages=2
+    )
+    return job.mark_completed()
+
+
+@pytest.fixture(scope="session")
+def sample_job_processing():
+    """Sample processing job entity."""
+    job = Job.create(
+        job_id="processing_job_789",
+        filename="processing.pdf",
+        source_path="/tmp/processing.pdf",
+        total_pages=1
+    )
+    return job.mark_processing()
+
+
+@pytest.fixture(scope="session")
+def sample_job_failed():
+    """Sample failed job entity."""
+    job = Job.create(
+        job_id="failed_job_101",
+        filename="failed.pdf",
+        source_path="/tmp/failed.pdf",
+        total_pages=5
+    )
+    return job.mark_failed("Processing error")
@@ -5,15 +5,13 @@ Tests the document processing workflow including file validation,
 OCR execution, and result persistence.
 """
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock
 from pathlib import Path
-from dataclasses import dataclass
 
 from backend.application.commands.process_document import (
     ProcessDocumentCommand,
     ProcessDocumentHandler
 )
-from backend.domain.entities.job import Job
 from backend.domain.entities.page_extraction import PageExtraction
 from backend.domain.entities.field_extraction import FieldExtraction
 from backend.domain.entities.table_extraction import TableExtraction
@@ -23,13 +21,8 @@ from backend.domain.value_objects.bounding_box import BoundingBox
 from backend.domain.exceptions import EntityNotFoundError, EntityValidationError
 
 
-@pytest.fixture
-def mock_job_repository():
-    """Mock job repository."""
-    repo = Mock()
-    repo.find_by_id = Mock(return_value=None)
-    repo.save = Mock(return_value=None)
-    return repo
+# Commands are frozen, so a single instance can be shared across tests.
+STANDARD_COMMAND = ProcessDocumentCommand(job_id="test_job_123", file_path="/tmp/test.pdf")
 
 
 @pytest.fixture
@@ -64,21 +57,14 @@ def mock_mapping_client():
     return client
 
 
-@pytest.fixture
-def sample_job():
-    """Sample job entity."""
-    return Job.create(
-        job_id="test_job_123",
-        filename="test.pdf",
-        source_path="/tmp/test.pdf",
-        total_pages=2
-    )
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ocr_results():
-    """Sample OCR extraction results."""
-    return [
+    """Sample OCR extraction results.
+
+    Built once per session; the handler only reads these pages, and
+    PageExtraction is frozen, so an immutable tuple can be shared.
+    """
+    return (
         PageExtraction.create(
             page_number=1,
             fields=[
@@ -111,18 +97,40 @@ def sample_ocr_results():
             ],
             tables=[]
         )
-    ]
+    )
 
 
 @pytest.fixture
-def handler(mock_job_repository, mock_page_repository, mock_ocr_service, mock_pdf_renderer, mock_mapping_client):
-    """ProcessDocument command handler."""
+def fake_path_exists(monkeypatch):
+    """Stub ``Path.exists``; flip ``["value"]`` to simulate a missing file."""
+    state = {"value": True, "calls": 0}
+
+    def _exists(self):
+        state["calls"] += 1
+        return state["value"]
+
+    monkeypatch.setattr(Path, "exists", _exists)
+    return state
+
+
+HANDLER_DEPENDENCIES = (
+    "mock_job_repository",
+    "mock_page_repository",
+    "mock_ocr_service",
+    "mock_pdf_renderer",
+    "mock_mapping_client",
+)
+
+
+@pytest.fixture
+def handler(request):
+    """ProcessDocument command handler.
+
+    Dependencies are resolved lazily so mocks are only built for tests that
+    actually request the handler.
+    """
     return ProcessDocumentHandler(
-        mock_job_repository,
-        mock_page_repository,
-        mock_ocr_service,
-        mock_pdf_renderer,
-        mock_mapping_client
+        *(request.getfixturevalue(name) for name in HANDLER_DEPENDENCIES)
     )
 
 
@@ -140,6 +148,12 @@ class TestProcessDocumentCommand:
         command = ProcessDocumentCommand(job_id="test_job", file_path="/path/to/file.pdf")
         with pytest.raises(Exception):  # Should be FrozenInstanceError or AttributeError
             command.job_id = "modified"
+    
+    def test_command_uses_slots(self):
+        """Test that command instances carry no per-instance __dict__."""
+        command = ProcessDocumentCommand(job_id="test_job", file_path="/path/to/file.pdf")
+        assert "__slots__" in ProcessDocumentCommand.__dict__
+        assert not hasattr(command, "__dict__")
 
 
 class TestProcessDocumentHandler:
@@ -154,56 +168,48 @@ class TestProcessDocumentHandler:
         with pytest.raises(EntityNotFoundError) as exc_info:
             handler.handle(command)
         
-        assert "Job" in str(exc_info.value)
-        assert "nonexistent_job" in str(exc_info.value)
+        message = str(exc_info.value)
+        assert "Job" in message and "nonexistent_job" in message
         mock_job_repository.find_by_id.assert_called_once_with("nonexistent_job")
     
-    def test_handle_job_already_processed(self, handler, mock_job_repository, sample_job):
-        """Test handling when job is already completed."""
-        completed_job = sample_job.mark_completed()
-        mock_job_repository.find_by_id.return_value = completed_job
-        
-        command = ProcessDocumentCommand(job_id="test_job_123", file_path="/tmp/test.pdf")
-        
-        with pytest.raises(EntityValidationError) as exc_info:
-            handler.handle(command)
-        
-        assert "already processed" in str(exc_info.value).lower()
-    
-    def test_handle_job_currently_processing(self, handler, mock_job_repository, sample_job):
-        """Test handling when job is currently being processed."""
-        processing_job = sample_job.mark_processing()
-        mock_job_repository.find_by_id.return_value = processing_job
+    @pytest.mark.parametrize(
+        "job_fixture, expected_message",
+        [
+            ("sample_job_completed", "already processed"),
+            ("sample_job_processing", "currently being processed"),
+        ],
+    )
+    def test_handle_job_not_processable(self, request, handler, mock_job_repository, job_fixture, expected_message):
+        """Test handling when job is already completed or currently being processed."""
+        job = request.getfixturevalue(job_fixture)
+        mock_job_repository.find_by_id.return_value = job
         
-        command = ProcessDocumentCommand(job_id="test_job_123", file_path="/tmp/test.pdf")
+        command = ProcessDocumentCommand(job_id=job.job_id, file_path="/tmp/test.pdf")
         
         with pytest.raises(EntityValidationError) as exc_info:
             handler.handle(command)
         
-        assert "currently being processed" in str(exc_info.value).lower()
+        assert expected_message in str(exc_info.value).lower()
     
-    @patch("pathlib.Path.exists")
-    def test_handle_file_not_found(self, mock_exists, handler, mock_job_repository, sample_job):
+    def test_handle_file_not_found(self, fake_path_exists, handler, mock_job_repository, sample_job):
         """Test handling when uploaded file doesn't exist."""
-        mock_exists.return_value = False
+        fake_path_exists["value"] = False
         mock_job_repository.find_by_id.return_value = sample_job
         
-        command = ProcessDocumentCommand(job_id="test_job_123", file_path="/tmp/test.pdf")
+        command = STANDARD_COMMAND
         
         with pytest.raises(EntityValidationError) as exc_info:
             handler.handle(command)
         
         assert "file not found" in str(exc_info.value).lower()
-        mock_exists.assert_called_once()
+        assert fake_path_exists["calls"] == 1
     
-    @patch("pathlib.Path.exists")
-    def test_handle_successful_processing(self, mock_exists, handler, mock_job_repository, mock_page_repository, mock_ocr_service, sample_job, sample_ocr_results):
+    def test_handle_successful_processing(self, fake_path_exists, handler, mock_job_repository, mock_page_repository, mock_ocr_service, sample_job, sample_ocr_results):
         """Test successful document processing."""
-        mock_exists.return_value = True
         mock_job_repository.find_by_id.return_value = sample_job
         mock_ocr_service.extract_data.return_value = sample_ocr_results
         
-        command = ProcessDocumentCommand(job_id="test_job_123", file_path="/tmp/test.pdf")
+        command = STANDARD_COMMAND
         
         result = handler.handle(command)
         
@@ -233,36 +239,12 @@ class TestProcessDocumentHandler:
         assert result["pages_processed"] == 2
         assert "extraction_summary" in result
     
-    @patch("pathlib.Path.exists")
-    def test_handle_ocr_extraction_error(self, mock_exists, handler, mock_job_repository, mock_page_repository, mock_ocr_service, sample_job):
-        """Test handling OCR service errors."""
-        mock_exists.return_value = True
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_ocr_service.extract_data.side_effect = Exception("OCR processing failed")
-        
-        command = ProcessDocumentCommand(job_id="test_job_123", file_path="/tmp/test.pdf")
-        
-        with pytest.raises(Exception) as exc_info:
-            handler.handle(command)
-        
-        assert "OCR processing failed" in str(exc_info.value)
-        
-        # Verify job was marked as failed
-        saved_calls = mock_job_repository.save.call_args_list
-        assert len(saved_calls) >= 2
-        
-        # Should have processing and failed status updates
-        failed_job = saved_calls[-1][0][0]
-        assert failed_job.status == JobStatus.FAILED
-    
-    @patch("pathlib.Path.exists")
-    def test_handle_empty_ocr_results(self, mock_exists, handler, mock_job_repository, mock_page_repository, mock_ocr_service, sample_job):
+    def test_handle_empty_ocr_results(self, fake_path_exists, handler, mock_job_repository, mock_page_repository, mock_ocr_service, sample_job):
         """Test handling when OCR returns no results."""
-        mock_exists.return_value = True
         mock_job_repository.find_by_id.return_value = sample_job
         mock_ocr_service.extract_data.return_value = []
         
-        command = ProcessDocumentCommand(job_id="test_job_123", file_path="/tmp/test.pdf")
+        command = STANDARD_COMMAND
         
         result = handler.handle(command)
         
@@ -279,15 +261,13 @@ class TestProcessDocumentHandler:
         completed_job = saved_calls[-1][0][0]
         assert completed_job.status == JobStatus.COMPLETED
     
-    @patch("pathlib.Path.exists")
-    def test_handle_partial_ocr_results(self, mock_exists, handler, mock_job_repository, mock_page_repository, mock_ocr_service, sample_job, sample_ocr_results):
+    def test_handle_partial_ocr_results(self, fake_path_exists, handler, mock_job_repository, mock_page_repository, mock_ocr_service, sample_job, sample_ocr_results):
         """Test handling when OCR returns fewer pages than expected."""
-        mock_exists.return_value = True
         mock_job_repository.find_by_id.return_value = sample_job
         # Return only first page result
         mock_ocr_service.extract_data.return_value = sample_ocr_results[:1]
         
-        command = ProcessDocumentCommand(job_id="test_job_123", file_path="/tmp/test.pdf")
+        command = STANDARD_COMMAND
         
         result = handler.handle(command)
         
@@ -299,34 +279,24 @@ class TestProcessDocumentHandler:
         # Only one page should be saved
         mock_page_repository.save_page.assert_called_once()
     
-    def test_handle_repository_save_error(self, handler, mock_job_repository, sample_job):
-        """Test handling repository save errors."""
-        mock_job_repository.find_by_id.return_value = sample_job
-        mock_job_repository.save.side_effect = Exception("Database error")
-        
-        command = ProcessDocumentCommand(job_id="test_job_123", file_path="/tmp/test.pdf")
-        
-        with pytest.raises(Exception) as exc_info:
-            handler.handle(command)
-        
-        assert "Database error" in str(exc_info.value)
-    
-    @patch("pathlib.Path.exists")
-    def test_handle_page_repository_save_error(self, mock_exists, handler, mock_job_repository, mock_page_repository, mock_ocr_service, sample_job, sample_ocr_results):
-        """Test handling page repository save errors."""
-        mock_exists.return_value = True
+    @pytest.mark.parametrize(
+        "broken_fixture, method, message",
+        [
+            ("mock_job_repository", "save", "Database error"),
+            ("mock_ocr_service", "extract_data", "OCR processing failed"),
+            ("mock_page_repository", "save_page", "Page save error"),
+        ],
+    )
+    def test_handle_dependency_failure(self, request, fake_path_exists, handler, mock_job_repository, mock_ocr_service, sample_job, sample_ocr_results, broken_fixture, method, message):
+        """Test that a failing dependency propagates and the job is marked failed."""
         mock_job_repository.find_by_id.return_value = sample_job
         mock_ocr_service.extract_data.return_value = sample_ocr_results
-        mock_page_repository.save_page.side_effect = Exception("Page save error")
-        
-        command = ProcessDocumentCommand(job_id="test_job_123", file_path="/tmp/test.pdf")
-        
-        with pytest.raises(Exception) as exc_info:
-            handler.handle(command)
+        broken = request.getfixturevalue(broken_fixture)
+        getattr(broken, method).side_effect = Exception(message)
         
-        assert "Page save error" in str(exc_info.value)
+        with pytest.raises(Exception, match=message):
+            handler.handle(STANDARD_COMMAND)
         
-        # Job should be marked as failed
-        saved_calls = mock_job_repository.save.call_args_list
-        failed_job = saved_calls[-1][0][0]
-        assert failed_job.status == JobStatus.FAILED
\ No newline at end of file
+        # Last save attempt should mark the job as failed
+        failed_job = mock_job_repository.save.call_args_list[-1][0][0]
+        assert failed_job.status == JobStatus.FAILED
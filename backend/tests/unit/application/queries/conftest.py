@@ -0,0 +1,64 @@
+"""Shared fixtures for query handler unit tests."""
+import pytest
+
+from backend.domain.entities.page_extraction import PageExtraction
+from backend.domain.entities.field_extraction import FieldExtraction
+from backend.domain.entities.table_extraction import TableExtraction, TableCell
+from backend.domain.value_objects.confidence import Confidence
+from backend.domain.value_objects.bounding_box import BoundingBox
+
+
+# Frozen value objects shared by the sample page.
+_BB_INVOICE = BoundingBox(0.1, 0.1, 0.3, 0.05)
+_BB_TOTAL = BoundingBox(0.7, 0.8, 0.2, 0.05)
+_BB_TABLE = BoundingBox(0.1, 0.3, 0.8, 0.4)
+_C92 = Confidence(0.92)
+_C91 = Confidence(0.91)
+_C90 = Confidence(0.90)
+_C89 = Confidence(0.89)
+
+
+@pytest.fixture(scope="session")
+def sample_page():
+    """Create a sample page with fields and tables.
+
+    Built once per session (and so once per xdist worker); handlers only
+    read it.
+    """
+    fields = [
+        FieldExtraction.create(
+            field_name="invoice_number",
+            value="INV-001",
+            confidence=0.95,
+            bounding_box=_BB_INVOICE,
+        ),
+        FieldExtraction.create(
+            field_name="total",
+            value="$1,234.56",
+            confidence=0.88,
+            bounding_box=_BB_TOTAL,
+        ).update_value("$1,234.56"),  # Mark as edited
+    ]
+
+    cells = [
+        TableCell(row=0, column=0, content="Description", confidence=_C92),
+        TableCell(row=0, column=1, content="Amount", confidence=_C91),
+        TableCell(row=1, column=0, content="Service A", confidence=_C90),
+        TableCell(row=1, column=1, content="$100", confidence=_C89),
+    ]
+
+    tables = [
+        TableExtraction.create(
+            cells=cells,
+            page_number=1,
+            confidence=0.90,
+            bounding_box=_BB_TABLE,
+            title="Line Items",
+        ),
+    ]
+
+    return PageExtraction.create(
+        page_number=1,
+        fields=fields,
+        tables=tables,
+    )
@@ -4,8 +4,6 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import List, Optional
 
-import pytest
-
 from backend.application.queries.get_aggregated_results import (
     GetAggregatedResultsHandler,
     GetAggregatedResultsQuery,
@@ -16,7 +14,6 @@ from backend.domain.entities.page_extraction import PageExtraction
 from backend.domain.repositories.job_repository import JobRepository
 from backend.domain.value_objects.confidence import Confidence
 from backend.domain.value_objects.job_status import JobStatus
-from backend.domain.exceptions import EntityNotFoundError
 
 
 class StubJobRepository(JobRepository):
@@ -82,9 +79,3 @@ def test_returns_aggregated_results():
     total_field = next(field for field in dto.fields if field.canonical_name == "Total")
     assert total_field.best_value == "100"
     assert total_field.confidence_stats["max"] == 0.9
-
-
-def test_raises_for_missing_job():
-    handler = GetAggregatedResultsHandler(StubJobRepository([]))
-    with pytest.raises(EntityNotFoundError):
-        handler.handle(GetAggregatedResultsQuery(job_id="missing"))
@@ -4,7 +4,6 @@ Unit tests for GetJobStatus query handler.
 Tests the query handler with a mocked repository to ensure:
 - Successful job retrieval
 - Proper DTO mapping
-- Error handling for not found jobs
 """
 import pytest
 from datetime import datetime
@@ -15,7 +14,6 @@ from backend.application.queries.get_job_status import (
     GetJobStatusHandler,
 )
 from backend.application.dto.job_dto import JobStatusDTO
-from backend.domain.exceptions import EntityNotFoundError
 from backend.domain.value_objects.job_status import JobStatus
 from backend.domain.entities.job import Job
 
@@ -115,19 +113,6 @@ class TestGetJobStatusHandler:
         assert result.status == "error"
         assert result.error_message == "Processing failed"
     
-    def test_handle_raises_not_found_when_job_missing(self, handler, mock_repository):
-        """Test raises EntityNotFoundError when job doesn't exist."""
-        # Arrange
-        query = GetJobStatusQuery(job_id="nonexistent")
-        mock_repository.find_by_id.return_value = None
-        
-        # Act & Assert
-        with pytest.raises(EntityNotFoundError) as exc_info:
-            handler.handle(query)
-        
-        assert "nonexistent" in str(exc_info.value)
-        mock_repository.find_by_id.assert_called_once_with("nonexistent")
-    
     def test_handle_calculates_processed_pages(self, handler, mock_repository):
         """Test processed_pages equals number of pages in job."""
         # Arrange
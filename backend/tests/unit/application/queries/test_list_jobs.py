@@ -18,25 +18,33 @@ from backend.application.queries.list_jobs import (
 )
 from backend.application.dto.job_dto import JobsListDTO
 from backend.domain.entities.job import Job
+from backend.domain.repositories.job_repository import JobRepository
 from backend.domain.value_objects.job_status import JobStatus
 
 
+_FIXED_NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
 class TestListJobsHandler:
     """Test cases for ListJobsHandler."""
     
     @pytest.fixture
     def mock_repository(self):
         """Create a mock job repository."""
-        return Mock()
+        return Mock(spec=JobRepository)
     
     @pytest.fixture
     def handler(self, mock_repository):
         """Create handler with mocked repository."""
         return ListJobsHandler(mock_repository)
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_jobs(self):
-        """Create sample jobs for testing."""
+        """Create sample jobs for testing.
+
+        Shared across the module: tests only hand the list to the mocked
+        repository and never mutate it.
+        """
         base_time = datetime(2025, 1, 1, 12, 0, 0)
         return [
             Job(
@@ -121,11 +129,12 @@ class TestListJobsHandler:
         result = handler.handle(query)
         
         # Assert
-        mock_repository.find_all.assert_called_once_with(
-            limit=10,
-            offset=10,  # (page-1) * page_size = (2-1) * 10 = 10
-            sort_desc=True,
-        )
+        assert mock_repository.find_all.call_count == 1
+        assert mock_repository.find_all.call_args.kwargs == {
+            "limit": 10,
+            "offset": 10,  # (page-1) * page_size = (2-1) * 10 = 10
+            "sort_desc": True,
+        }
         assert result.page == 2
         assert result.page_size == 10
         assert result.total == 25
@@ -140,8 +149,8 @@ class TestListJobsHandler:
                 status=JobStatus.completed(),
                 total_pages=5,
                 pages=[],
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+                created_at=_FIXED_NOW,
+                updated_at=_FIXED_NOW,
             ),
         ]
         query = ListJobsQuery(status_filter="completed")
@@ -176,40 +185,6 @@ class TestListJobsHandler:
         )
         mock_repository.count.assert_called_once_with(status="running")
     
-    def test_handle_with_sort_ascending(self, handler, mock_repository):
-        """Test ascending sort order."""
-        # Arrange
-        query = ListJobsQuery(sort_order=SortOrder.ASC)
-        mock_repository.find_all.return_value = []
-        mock_repository.count.return_value = 0
-        
-        # Act
-        handler.handle(query)
-        
-        # Assert
-        mock_repository.find_all.assert_called_once_with(
-            limit=20,
-            offset=0,
-            sort_desc=False,  # ASC = sort_desc=False
-        )
-    
-    def test_handle_with_sort_descending(self, handler, mock_repository):
-        """Test descending sort order (default)."""
-        # Arrange
-        query = ListJobsQuery(sort_order=SortOrder.DESC)
-        mock_repository.find_all.return_value = []
-        mock_repository.count.return_value = 0
-        
-        # Act
-        handler.handle(query)
-        
-        # Assert
-        mock_repository.find_all.assert_called_once_with(
-            limit=20,
-            offset=0,
-            sort_desc=True,  # DESC = sort_desc=True
-        )
-    
     def test_handle_with_empty_results(self, handler, mock_repository):
         """Test handling when no jobs exist."""
         # Arrange
@@ -226,10 +201,20 @@ class TestListJobsHandler:
         assert result.page == 1
         assert result.page_size == 20
     
-    def test_handle_default_pagination(self, handler, mock_repository):
-        """Test default pagination values."""
+    @pytest.mark.parametrize(
+        "query_kwargs, expected_call",
+        [
+            # Default page=1, page_size=20, DESC
+            ({}, {"limit": 20, "offset": 0, "sort_desc": True}),
+            ({"sort_order": SortOrder.ASC}, {"limit": 20, "offset": 0, "sort_desc": False}),
+            ({"sort_order": SortOrder.DESC}, {"limit": 20, "offset": 0, "sort_desc": True}),
+        ],
+        ids=["default", "sort_ascending", "sort_descending"],
+    )
+    def test_handle_passes_paging_and_sort_to_repository(self, handler, mock_repository, query_kwargs, expected_call):
+        """Test default pagination and sort order reach the repository."""
         # Arrange
-        query = ListJobsQuery()  # Default page=1, page_size=20
+        query = ListJobsQuery(**query_kwargs)
         mock_repository.find_all.return_value = []
         mock_repository.count.return_value = 0
         
@@ -237,29 +222,25 @@ class TestListJobsHandler:
         handler.handle(query)
         
         # Assert
-        mock_repository.find_all.assert_called_once_with(
-            limit=20,
-            offset=0,
-            sort_desc=True,
-        )
+        assert mock_repository.find_all.call_count == 1
+        assert mock_repository.find_all.call_args.kwargs == expected_call
     
-    def test_handle_calculates_offset_correctly(self, handler, mock_repository):
+    @pytest.mark.parametrize(
+        "page, page_size, expected_offset",
+        [(1, 10, 0), (3, 10, 20), (5, 25, 100)],
+    )
+    def test_handle_calculates_offset_correctly(self, handler, mock_repository, page, page_size, expected_offset):
         """Test offset calculation for various pages."""
         # Arrange
         mock_repository.find_all.return_value = []
         mock_repository.count.return_value = 0
         
-        # Test page 1
-        handler.handle(ListJobsQuery(page=1, page_size=10))
-        assert mock_repository.find_all.call_args[1]["offset"] == 0
-        
-        # Test page 3
-        handler.handle(ListJobsQuery(page=3, page_size=10))
-        assert mock_repository.find_all.call_args[1]["offset"] == 20
+        # Act
+        handler.handle(ListJobsQuery(page=page, page_size=page_size))
         
-        # Test page 5 with different page size
-        handler.handle(ListJobsQuery(page=5, page_size=25))
-        assert mock_repository.find_all.call_args[1]["offset"] == 100
+        # Assert - offset = (page-1) * page_size
+        assert mock_repository.find_all.call_count == 1
+        assert mock_repository.find_all.call_args.kwargs["offset"] == expected_offset
     
     def test_query_is_immutable(self):
         """Test query object is immutable."""
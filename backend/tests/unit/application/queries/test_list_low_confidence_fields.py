@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Callable, List, Optional
+
+import pytest
 
 from backend.application.queries.list_low_confidence_fields import (
     ListLowConfidenceFieldsHandler,
@@ -15,17 +17,21 @@ from backend.domain.repositories.job_repository import JobRepository
 from backend.domain.value_objects.job_status import JobStatus
 
 
+_FIXED_NOW = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
 class StubJobRepository(JobRepository):
     """In-memory repository for low-confidence field tests."""
 
     def __init__(self, jobs: List[Job]):
         self._jobs = jobs
+        self._by_id = {job.job_id: job for job in jobs}
 
     def save(self, job: Job) -> None:  # pragma: no cover - not required
         raise NotImplementedError
 
     def find_by_id(self, job_id: str) -> Optional[Job]:  # pragma: no cover - not required
-        return next((job for job in self._jobs if job.job_id == job_id), None)
+        return self._by_id.get(job_id)
 
     def find_all(self, limit: Optional[int] = None, offset: int = 0, sort_desc: bool = True) -> List[Job]:
         return list(self._jobs)
@@ -43,36 +49,46 @@ class StubJobRepository(JobRepository):
         raise NotImplementedError
 
     def exists(self, job_id: str) -> bool:  # pragma: no cover - not required
-        return any(job.job_id == job_id for job in self._jobs)
+        return job_id in self._by_id
 
     def count(self, status: Optional[str] = None) -> int:  # pragma: no cover - not required
         return len(self._jobs)
 
 
-def make_job(job_id: str, confidences: List[float]) -> Job:
-    fields = [
-        FieldExtraction.create(
-            field_name=f"field-{index}",
-            value=f"value-{index}",
-            confidence=confidence,
+@pytest.fixture(scope="session")
+def _completed_status() -> JobStatus:
+    return JobStatus.completed()
+
+
+@pytest.fixture(scope="session")
+def make_job(_completed_status: JobStatus) -> Callable[[str, List[float]], Job]:
+    """Factory building a single-page completed job with the given field confidences."""
+
+    def _factory(job_id: str, confidences: List[float]) -> Job:
+        fields = [
+            FieldExtraction.create(
+                field_name=f"field-{index}",
+                value=f"value-{index}",
+                confidence=confidence,
+            )
+            for index, confidence in enumerate(confidences, start=1)
+        ]
+        page = PageExtraction.create(page_number=1, fields=fields)
+        return Job(
+            job_id=job_id,
+            filename=f"{job_id}.pdf",
+            status=_completed_status,
+            total_pages=1,
+            pages=[page],
+            created_at=_FIXED_NOW,
+            updated_at=_FIXED_NOW,
+            source_path=None,
         )
-        for index, confidence in enumerate(confidences, start=1)
-    ]
-    page = PageExtraction.create(page_number=1, fields=fields)
-    now = datetime.now(timezone.utc)
-    return Job(
-        job_id=job_id,
-        filename=f"{job_id}.pdf",
-        status=JobStatus.completed(),
-        total_pages=1,
-        pages=[page],
-        created_at=now,
-        updated_at=now,
-        source_path=None,
-    )
-
-
-def test_returns_low_confidence_fields_sorted():
+
+    return _factory
+
+
+def test_returns_low_confidence_fields_sorted(make_job):
     job = make_job("job-a", [0.35, 0.55, 0.2])
     handler = ListLowConfidenceFieldsHandler(StubJobRepository([job]))
 
@@ -82,14 +98,27 @@ def test_returns_low_confidence_fields_sorted():
     assert results[0].confidence <= results[1].confidence
 
 
-def test_applies_limit_and_job_filter():
+@pytest.fixture(scope="module")
+def two_jobs_repo(make_job) -> StubJobRepository:
+    """Repository holding two completed jobs with low-confidence fields."""
     job_a = make_job("job-a", [0.3, 0.8])
     job_b = make_job("job-b", [0.25])
-    handler = ListLowConfidenceFieldsHandler(StubJobRepository([job_a, job_b]))
+    return StubJobRepository([job_a, job_b])
+
+
+@pytest.mark.parametrize(
+    "query, expected_count, expected_job_id",
+    [
+        (ListLowConfidenceFieldsQuery(limit=1), 1, None),
+        (ListLowConfidenceFieldsQuery(job_id="job-b"), 1, "job-b"),
+    ],
+    ids=["limit", "job_filter"],
+)
+def test_applies_limit_and_job_filter(two_jobs_repo, query, expected_count, expected_job_id):
+    handler = ListLowConfidenceFieldsHandler(two_jobs_repo)
 
-    limited = handler.handle(ListLowConfidenceFieldsQuery(limit=1))
-    assert len(limited) == 1
+    results = handler.handle(query)
 
-    filtered = handler.handle(ListLowConfidenceFieldsQuery(job_id="job-b"))
-    assert len(filtered) == 1
-    assert filtered[0].job_id == "job-b"
+    assert len(results) == expected_count
+    if expected_job_id is not None:
+        assert all(item.job_id == expected_job_id for item in results)
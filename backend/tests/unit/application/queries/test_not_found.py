@@ -0,0 +1,70 @@
+"""
+Shared not-found behaviour for single-repository query handlers.
+
+Each case wires a handler to a mocked repository whose finder returns None
+and checks that EntityNotFoundError is raised with the requested identifiers.
+"""
+import pytest
+from unittest.mock import Mock
+
+from backend.application.queries.get_aggregated_results import (
+    GetAggregatedResultsHandler,
+    GetAggregatedResultsQuery,
+)
+from backend.application.queries.get_job_status import (
+    GetJobStatusHandler,
+    GetJobStatusQuery,
+)
+from backend.application.queries.get_page_data import (
+    GetPageDataHandler,
+    GetPageDataQuery,
+)
+from backend.domain.exceptions import EntityNotFoundError
+from backend.domain.repositories.job_repository import JobRepository
+from backend.domain.repositories.page_repository import PageRepository
+
+
+NOT_FOUND_CASES = [
+    pytest.param(
+        GetPageDataHandler,
+        PageRepository,
+        GetPageDataQuery(job_id="job-123", page_number=99),
+        "find_page",
+        ("job-123", 99),
+        id="get_page_data",
+    ),
+    pytest.param(
+        GetJobStatusHandler,
+        JobRepository,
+        GetJobStatusQuery(job_id="nonexistent"),
+        "find_by_id",
+        ("nonexistent",),
+        id="get_job_status",
+    ),
+    pytest.param(
+        GetAggregatedResultsHandler,
+        JobRepository,
+        GetAggregatedResultsQuery(job_id="missing"),
+        "find_by_id",
+        ("missing",),
+        id="get_aggregated_results",
+    ),
+]
+
+
+@pytest.mark.parametrize("handler_cls, repository_spec, query, finder, finder_args", NOT_FOUND_CASES)
+def test_handle_raises_not_found(handler_cls, repository_spec, query, finder, finder_args):
+    """Test handlers raise EntityNotFoundError naming the missing identifiers."""
+    # Arrange
+    repository = Mock(spec=repository_spec)
+    getattr(repository, finder).return_value = None
+    handler = handler_cls(repository)
+
+    # Act & Assert
+    with pytest.raises(EntityNotFoundError) as exc_info:
+        handler.handle(query)
+
+    message = str(exc_info.value)
+    for arg in finder_args:
+        assert str(arg) in message
+    getattr(repository, finder).assert_called_once_with(*finder_args)
@@ -1,22 +1,43 @@
 """
 Unit tests for FieldExtraction entity
+
+These tests share no filesystem or repository state, so the module is safe
+to run under ``pytest -n auto`` (pytest-xdist) without an ``xdist_group``.
 """
 import pytest
-import sys
-from datetime import datetime
-from pathlib import Path
 from uuid import UUID, uuid4
 
-# Add project root to Python path
-project_root = Path(__file__).resolve().parents[5]
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
 from backend.domain.entities.field_extraction import FieldExtraction
 from backend.domain.value_objects.bounding_box import BoundingBox
 from backend.domain.value_objects.confidence import Confidence
 
 
+FIXED_ID = UUID("12345678-1234-5678-1234-567812345678")
+
+# from_dict only reads its input, so these payloads can be shared as-is.
+_BASIC_DICT = {'field_name': 'invoice_number', 'value': 'INV-12345', 'confidence': 0.95}
+_BBOX_DICT = {
+    'field_name': 'name',
+    'value': 'John Doe',
+    'bounding_box': {'x': 0.1, 'y': 0.2, 'width': 0.3, 'height': 0.4}
+}
+_NESTED_CONFIDENCE_DICT = {'field_name': 'amount', 'value': '100', 'confidence': {'value': 0.88}}
+
+
+@pytest.fixture(scope="module")
+def sample_bbox():
+    """Shared, immutable bounding box used by location-related tests."""
+    return BoundingBox(0.1, 0.2, 0.3, 0.4)
+
+
+@pytest.fixture
+def make_field():
+    """Factory for throwaway fields named "test"; override any create() argument."""
+    def _make(value="test", confidence=0.5, **kwargs):
+        return FieldExtraction.create(field_name="test", value=value, confidence=confidence, **kwargs)
+    return _make
+
+
 class TestFieldExtractionCreation:
     """Test FieldExtraction object creation."""
     
@@ -30,7 +51,6 @@ class TestFieldExtractionCreation:
         assert field.value == "INV-12345"
         assert field.field_type == "text"
         assert isinstance(field.id, UUID)
-        assert isinstance(field.confidence, Confidence)
         assert field.page_number == 1
     
     def test_create_with_confidence(self):
@@ -40,17 +60,16 @@ class TestFieldExtractionCreation:
             value="$1,234.56",
             confidence=0.95
         )
-        assert field.confidence.value == 0.95
+        assert field.confidence.value == pytest.approx(0.95)
     
-    def test_create_with_bounding_box(self):
+    def test_create_with_bounding_box(self, sample_bbox):
         """Test creating field with location."""
-        bbox = BoundingBox(0.1, 0.2, 0.3, 0.4)
         field = FieldExtraction.create(
             field_name="name",
             value="John Doe",
-            bounding_box=bbox
+            bounding_box=sample_bbox
         )
-        assert field.bounding_box == bbox
+        assert field.bounding_box == sample_bbox
         assert field.has_location()
     
     def test_create_with_page_number(self):
@@ -117,7 +136,7 @@ class TestFieldExtractionValidation:
             confidence=0.85
         )
         assert isinstance(field.confidence, Confidence)
-        assert field.confidence.value == 0.85
+        assert field.confidence.value == pytest.approx(0.85)
 
 
 class TestFieldExtractionFromDict:
@@ -125,36 +144,21 @@ class TestFieldExtractionFromDict:
     
     def test_from_dict_basic(self):
         """Test creating from basic dictionary."""
-        data = {
-            'field_name': 'invoice_number',
-            'value': 'INV-12345',
-            'confidence': 0.95
-        }
-        field = FieldExtraction.from_dict(data)
+        field = FieldExtraction.from_dict(_BASIC_DICT)
         assert field.field_name == 'invoice_number'
         assert field.value == 'INV-12345'
-        assert field.confidence.value == 0.95
+        assert field.confidence.value == pytest.approx(0.95)
     
     def test_from_dict_with_bbox(self):
         """Test creating from dict with bounding box."""
-        data = {
-            'field_name': 'name',
-            'value': 'John Doe',
-            'bounding_box': {'x': 0.1, 'y': 0.2, 'width': 0.3, 'height': 0.4}
-        }
-        field = FieldExtraction.from_dict(data)
+        field = FieldExtraction.from_dict(_BBOX_DICT)
         assert field.bounding_box is not None
         assert field.bounding_box.x == 0.1
     
     def test_from_dict_with_nested_confidence(self):
         """Test creating from dict with nested confidence object."""
-        data = {
-            'field_name': 'amount',
-            'value': '100',
-            'confidence': {'value': 0.88}
-        }
-        field = FieldExtraction.from_dict(data)
-        assert field.confidence.value == 0.88
+        field = FieldExtraction.from_dict(_NESTED_CONFIDENCE_DICT)
+        assert field.confidence.value == pytest.approx(0.88)
     
     def test_from_dict_with_id(self):
         """Test creating from dict preserves ID."""
@@ -182,151 +186,112 @@ class TestFieldExtractionToDict:
         
         assert data['field_name'] == 'invoice_number'
         assert data['value'] == 'INV-12345'
-        assert data['confidence'] == 0.95
+        assert data['confidence'] == pytest.approx(0.95)
         assert 'id' in data
         assert isinstance(data['id'], str)
     
-    def test_to_dict_with_bbox(self):
+    def test_to_dict_with_bbox(self, sample_bbox):
         """Test dictionary includes bounding box."""
-        bbox = BoundingBox(0.1, 0.2, 0.3, 0.4)
         field = FieldExtraction.create(
             field_name="name",
             value="John",
-            bounding_box=bbox
+            bounding_box=sample_bbox
         )
         data = field.to_dict()
         
         assert data['bounding_box'] is not None
         assert data['bounding_box']['x'] == 0.1
     
-    def test_to_dict_roundtrip(self):
+    @pytest.mark.parametrize(
+        "value, confidence, page_number, source",
+        [
+            ("value", 0.75, 2, "test-source"),
+            ("", 0.1, 1, "empty-source"),
+            ("ünïçødé", 0.99, 10, "unicode-source"),
+        ],
+    )
+    def test_to_dict_roundtrip(self, value, confidence, page_number, source):
         """Test to_dict -> from_dict roundtrip."""
         original = FieldExtraction.create(
             field_name="test",
-            value="value",
-            confidence=0.75,
-            page_number=2,
-            source="test-source"
+            value=value,
+            confidence=confidence,
+            page_number=page_number,
+            source=source
         )
         data = original.to_dict()
         restored = FieldExtraction.from_dict(data)
         
         assert restored.field_name == original.field_name
         assert restored.value == original.value
-        assert restored.confidence.value == original.confidence.value
+        assert restored.confidence.value == pytest.approx(original.confidence.value)
         assert restored.page_number == original.page_number
         assert restored.source == original.source
 
 
+# The needs_review checks only read these fields, so build each once per class.
+@pytest.fixture(scope="class")
+def high_conf_field():
+    return FieldExtraction.create(field_name="test", value="something", confidence=0.9)
+
+
+@pytest.fixture(scope="class")
+def low_conf_field():
+    return FieldExtraction.create(field_name="test", value="something", confidence=0.5)
+
+
+@pytest.fixture(scope="class")
+def empty_field():
+    return FieldExtraction.create(field_name="test", value="", confidence=0.9)
+
+
 class TestFieldExtractionQueries:
     """Test FieldExtraction query methods."""
     
-    def test_is_empty_true(self):
-        """Test is_empty for empty field."""
-        field = FieldExtraction.create(field_name="test", value="")
-        assert field.is_empty()
-    
-    def test_is_empty_false(self):
-        """Test is_empty for field with value."""
-        field = FieldExtraction.create(field_name="test", value="something")
-        assert not field.is_empty()
-    
-    def test_has_value_true(self):
-        """Test has_value for field with value."""
-        field = FieldExtraction.create(field_name="test", value="something")
-        assert field.has_value()
-    
-    def test_has_value_false(self):
-        """Test has_value for empty field."""
-        field = FieldExtraction.create(field_name="test", value="")
-        assert not field.has_value()
-    
-    def test_is_high_confidence_true(self):
-        """Test is_high_confidence for high confidence field."""
-        field = FieldExtraction.create(
-            field_name="test",
-            value="test",
-            confidence=0.95
-        )
-        assert field.is_high_confidence(threshold=0.8)
-    
-    def test_is_high_confidence_false(self):
-        """Test is_high_confidence for low confidence field."""
-        field = FieldExtraction.create(
-            field_name="test",
-            value="test",
-            confidence=0.6
-        )
-        assert not field.is_high_confidence(threshold=0.8)
-    
-    def test_is_low_confidence_true(self):
-        """Test is_low_confidence for low confidence field."""
-        field = FieldExtraction.create(
-            field_name="test",
-            value="test",
-            confidence=0.3
-        )
-        assert field.is_low_confidence(threshold=0.5)
-    
-    def test_is_low_confidence_false(self):
-        """Test is_low_confidence for high confidence field."""
-        field = FieldExtraction.create(
-            field_name="test",
-            value="test",
-            confidence=0.8
-        )
-        assert not field.is_low_confidence(threshold=0.5)
-    
-    def test_needs_review_empty(self):
+    @pytest.mark.parametrize(
+        "method, value, confidence, kwargs, expected",
+        [
+            ("is_empty", "", 0.0, {}, True),
+            ("is_empty", "something", 0.0, {}, False),
+            ("has_value", "something", 0.0, {}, True),
+            ("has_value", "", 0.0, {}, False),
+            ("is_high_confidence", "test", 0.95, {"threshold": 0.8}, True),
+            ("is_high_confidence", "test", 0.6, {"threshold": 0.8}, False),
+            ("is_low_confidence", "test", 0.3, {"threshold": 0.5}, True),
+            ("is_low_confidence", "test", 0.8, {"threshold": 0.5}, False),
+        ],
+    )
+    def test_predicate(self, make_field, method, value, confidence, kwargs, expected):
+        """Test value and confidence predicates."""
+        field = make_field(value=value, confidence=confidence)
+        assert getattr(field, method)(**kwargs) is expected
+    
+    def test_needs_review_empty(self, empty_field):
         """Test needs_review for empty field."""
-        field = FieldExtraction.create(
-            field_name="test",
-            value="",
-            confidence=0.9
-        )
-        assert field.needs_review()
+        assert empty_field.needs_review()
     
-    def test_needs_review_low_confidence(self):
+    def test_needs_review_low_confidence(self, low_conf_field):
         """Test needs_review for low confidence field."""
-        field = FieldExtraction.create(
-            field_name="test",
-            value="something",
-            confidence=0.5
-        )
-        assert field.needs_review(confidence_threshold=0.7)
+        assert low_conf_field.needs_review(confidence_threshold=0.7)
     
-    def test_needs_review_false(self):
+    def test_needs_review_false(self, high_conf_field):
         """Test needs_review false for good field."""
-        field = FieldExtraction.create(
-            field_name="test",
-            value="something",
-            confidence=0.9
-        )
-        assert not field.needs_review(confidence_threshold=0.7)
+        assert not high_conf_field.needs_review(confidence_threshold=0.7)
     
-    def test_has_location_true(self):
+    def test_has_location_true(self, make_field, sample_bbox):
         """Test has_location for field with valid bbox."""
-        bbox = BoundingBox(0.1, 0.2, 0.3, 0.4)
-        field = FieldExtraction.create(
-            field_name="test",
-            value="test",
-            bounding_box=bbox
-        )
+        field = make_field(bounding_box=sample_bbox)
         assert field.has_location()
     
-    def test_has_location_false_no_bbox(self):
+    def test_has_location_false_no_bbox(self, make_field):
         """Test has_location false when no bbox."""
-        field = FieldExtraction.create(field_name="test", value="test")
+        field = make_field()
         assert not field.has_location()
     
-    def test_has_location_false_invalid_bbox(self):
+    def test_has_location_false_invalid_bbox(self, make_field):
         """Test has_location false for invalid bbox."""
         bbox = BoundingBox(0.0, 0.0, 0.0, 0.0)  # Empty bbox
-        field = FieldExtraction.create(
-            field_name="test",
-            value="test",
-            bounding_box=bbox
-        )
+        field = make_field(bounding_box=bbox)
         assert not field.has_location()
 
 
@@ -344,11 +309,11 @@ class TestFieldExtractionMutations:
         
         # New instance with updated value
         assert updated.value == "John Doe"
-        assert updated.confidence.value == 0.95
+        assert updated.confidence.value == pytest.approx(0.95)
         
         # Original unchanged
         assert original.value == "John"
-        assert original.confidence.value == 0.8
+        assert original.confidence.value == pytest.approx(0.8)
         
         # Same ID
         assert updated.id == original.id
@@ -363,7 +328,7 @@ class TestFieldExtractionMutations:
         updated = original.update_value("Jane")
         
         assert updated.value == "Jane"
-        assert updated.confidence.value == 0.8
+        assert updated.confidence.value == pytest.approx(0.8)
     
     def test_normalize_value(self):
         """Test normalizing value creates new instance."""
@@ -418,22 +383,22 @@ class TestFieldExtractionEquality:
     
     def test_equality_same_id(self):
         """Test equality based on ID."""
-        field_id = uuid4()
+        field_id = FIXED_ID
         field1 = FieldExtraction(id=field_id, field_name="test", value="val1")
         field2 = FieldExtraction(id=field_id, field_name="test", value="val2")
         
         assert field1 == field2  # Same ID
     
-    def test_equality_different_id(self):
+    def test_equality_different_id(self, make_field):
         """Test inequality for different IDs."""
-        field1 = FieldExtraction.create(field_name="test", value="val")
-        field2 = FieldExtraction.create(field_name="test", value="val")
+        field1 = make_field(value="val")
+        field2 = make_field(value="val")
         
         assert field1 != field2  # Different IDs
     
     def test_hash_consistency(self):
         """Test hash is based on ID."""
-        field_id = uuid4()
+        field_id = FIXED_ID
         field1 = FieldExtraction(id=field_id, field_name="test", value="val1")
         field2 = FieldExtraction(id=field_id, field_name="test", value="val2")
         
@@ -441,10 +406,8 @@ class TestFieldExtractionEquality:
     
     def test_can_use_in_set(self):
         """Test fields can be used in sets."""
-        field1 = FieldExtraction.create(field_name="test1", value="val")
-        field2 = FieldExtraction.create(field_name="test2", value="val")
-        field_set = {field1, field2}
+        fields = [FieldExtraction.create(field_name=f"test{i}", value="val") for i in range(2)]
+        field_set = set(fields)
         
         assert len(field_set) == 2
-        assert field1 in field_set
-        assert field2 in field_set
+        assert all(field in field_set for field in fields)
@@ -2,6 +2,8 @@
 Unit tests for PageExtraction entity.
 """
 
+import re
+
 import pytest
 from uuid import uuid4
 
@@ -12,56 +14,82 @@ from backend.domain.value_objects.bounding_box import BoundingBox
 from backend.domain.value_objects.confidence import Confidence
 
 
-@pytest.fixture
+SAMPLE_FIELD_CONF = 0.95
+SAMPLE_FIELD_LOW_CONF = 0.35
+SAMPLE_TABLE_CONF = 0.95
+SAMPLE_TABLE_LOW_CONF = 0.4
+
+AVG_FIELDS = (SAMPLE_FIELD_CONF + SAMPLE_FIELD_LOW_CONF) / 2
+AVG_TABLES = (SAMPLE_TABLE_CONF + SAMPLE_TABLE_LOW_CONF) / 2
+AVG_FIELD_TABLE = (SAMPLE_FIELD_CONF + SAMPLE_TABLE_CONF) / 2
+
+_ERR_PAGE_NUMBER = re.compile(r"Page number must be >= 1")
+_ERR_FIELD_TEST_NOT_FOUND = re.compile(r"Field 'test' not found")
+_ERR_TABLE_TEST_NOT_FOUND = re.compile(r"Table 'Test' not found")
+_ERR_DUPLICATE_FIELD = re.compile(r"Field 'invoice_number' already exists")
+_ERR_DUPLICATE_TABLE = re.compile(r"Table 'LineItems' already exists")
+_ERR_FIELD_NONEXISTENT_NOT_FOUND = re.compile(r"Field 'nonexistent' not found")
+_ERR_TABLE_NONEXISTENT_NOT_FOUND = re.compile(r"Table 'NonExistent' not found")
+
+
+# Confidence is frozen, so one instance serves every 0.9-confidence table and cell.
+_CONF_09 = Confidence(0.9)
+
+# TableCell is frozen, so the cell rows can be shared by every table built from them.
+_LINE_ITEMS_CELLS = (
+    TableCell(row=0, column=0, content="Product", confidence=Confidence(0.98)),
+    TableCell(row=0, column=1, content="Price", confidence=Confidence(0.98)),
+    TableCell(row=1, column=0, content="Widget", confidence=Confidence(0.95)),
+    TableCell(row=1, column=1, content="$10.00", confidence=Confidence(0.92)),
+)
+_CUSTOMER_INFO_CELLS = (
+    TableCell(row=0, column=0, content="Name", confidence=Confidence(0.98)),
+    TableCell(row=1, column=0, content="John", confidence=Confidence(0.25)),  # Low
+)
+
+
+# Fixtures are module-scoped: tests only read them, and page/table mutators
+# return new instances rather than modifying the shared objects.
+@pytest.fixture(scope="module")
 def sample_field():
     """Sample field extraction."""
     return FieldExtraction.create(
         field_name="invoice_number",
         value="INV-001",
-        confidence=0.95,
+        confidence=SAMPLE_FIELD_CONF,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_field_low_conf():
     """Sample low-confidence field."""
     return FieldExtraction.create(
         field_name="total_amount",
         value="$1,234.56",
-        confidence=0.35,
+        confidence=SAMPLE_FIELD_LOW_CONF,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_table():
     """Sample table extraction."""
-    cells = [
-        TableCell(row=0, column=0, content="Product", confidence=Confidence(0.98)),
-        TableCell(row=0, column=1, content="Price", confidence=Confidence(0.98)),
-        TableCell(row=1, column=0, content="Widget", confidence=Confidence(0.95)),
-        TableCell(row=1, column=1, content="$10.00", confidence=Confidence(0.92)),
-    ]
     return TableExtraction(
         id=uuid4(),
-        cells=cells,
+        cells=list(_LINE_ITEMS_CELLS),
         page_number=1,
-        confidence=Confidence(0.95),
+        confidence=Confidence(SAMPLE_TABLE_CONF),
         title="LineItems",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_table_low_conf():
     """Sample table with low confidence cells."""
-    cells = [
-        TableCell(row=0, column=0, content="Name", confidence=Confidence(0.98)),
-        TableCell(row=1, column=0, content="John", confidence=Confidence(0.25)),  # Low
-    ]
     return TableExtraction(
         id=uuid4(),
-        cells=cells,
+        cells=list(_CUSTOMER_INFO_CELLS),
         page_number=1,
-        confidence=Confidence(0.4),  # Low overall confidence
+        confidence=Confidence(SAMPLE_TABLE_LOW_CONF),  # Low overall confidence
         title="CustomerInfo",
     )
 
@@ -98,10 +126,10 @@ def test_page_extraction_with_data(sample_field, sample_table):
 
 def test_page_number_validation():
     """Test page number must be >= 1."""
-    with pytest.raises(ValueError, match="Page number must be >= 1"):
+    with pytest.raises(ValueError, match=_ERR_PAGE_NUMBER):
         PageExtraction.create(page_number=0)
     
-    with pytest.raises(ValueError, match="Page number must be >= 1"):
+    with pytest.raises(ValueError, match=_ERR_PAGE_NUMBER):
         PageExtraction.create(page_number=-1)
 
 
@@ -155,70 +183,56 @@ def test_is_empty():
     assert not page.is_empty
 
 
-def test_overall_confidence_empty_page():
-    """Test overall confidence for empty page is 1.0."""
-    page = PageExtraction.create(page_number=1)
-    assert page.overall_confidence.value == 1.0
-
-
-def test_overall_confidence_with_fields(sample_field, sample_field_low_conf):
-    """Test overall confidence calculation with fields."""
+@pytest.mark.parametrize(
+    "field_keys, table_keys, expected",
+    [
+        pytest.param((), (), 1.0, id="empty_page"),
+        pytest.param(("sample_field", "sample_field_low_conf"), (), AVG_FIELDS, id="fields"),
+        pytest.param((), ("sample_table", "sample_table_low_conf"), AVG_TABLES, id="tables"),
+        pytest.param(("sample_field",), ("sample_table",), AVG_FIELD_TABLE, id="mixed"),
+    ],
+)
+def test_overall_confidence(request, field_keys, table_keys, expected):
+    """Test overall confidence averages field and table confidences (1.0 when empty)."""
     page = PageExtraction.create(
         page_number=1,
-        fields=[sample_field, sample_field_low_conf],
+        fields=[request.getfixturevalue(key) for key in field_keys],
+        tables=[request.getfixturevalue(key) for key in table_keys],
     )
     
-    # (0.95 + 0.35) / 2 = 0.65
-    assert abs(page.overall_confidence.value - 0.65) < 0.01
+    assert page.overall_confidence.value == pytest.approx(expected, abs=0.01)
 
 
-def test_overall_confidence_with_tables(sample_table, sample_table_low_conf):
-    """Test overall confidence calculation with tables."""
-    page = PageExtraction.create(
-        page_number=1,
-        tables=[sample_table, sample_table_low_conf],
-    )
-    
-    # Should average the confidence of both tables
-    avg = (sample_table.confidence.value + sample_table_low_conf.confidence.value) / 2
-    assert abs(page.overall_confidence.value - avg) < 0.01
+@pytest.fixture(scope="module")
+def single_field_page(sample_field):
+    """Page holding only sample_field."""
+    return PageExtraction.create(page_number=1, fields=[sample_field])
 
 
-def test_overall_confidence_mixed(sample_field, sample_table):
-    """Test overall confidence with both fields and tables."""
-    page = PageExtraction.create(
-        page_number=1,
-        fields=[sample_field],
-        tables=[sample_table],
-    )
-    
-    # Should average field confidence and table confidence
-    avg = (sample_field.confidence.value + sample_table.confidence.value) / 2
-    assert abs(page.overall_confidence.value - avg) < 0.01
+@pytest.fixture(scope="module")
+def single_table_page(sample_table):
+    """Page holding only sample_table."""
+    return PageExtraction.create(page_number=1, tables=[sample_table])
 
 
-def test_get_field_by_name(sample_field):
+@pytest.mark.parametrize("name, expected", [("invoice_number", True), ("nonexistent", False)])
+def test_get_field_by_name(single_field_page, name, expected):
     """Test finding field by name."""
-    page = PageExtraction.create(page_number=1, fields=[sample_field])
+    found = single_field_page.get_field_by_name(name)
     
-    found = page.get_field_by_name("invoice_number")
-    assert found is not None
-    assert found.field_name == "invoice_number"
-    
-    not_found = page.get_field_by_name("nonexistent")
-    assert not_found is None
+    assert (found is not None) is expected
+    if expected:
+        assert found.field_name == name
 
 
-def test_get_table_by_title(sample_table):
+@pytest.mark.parametrize("title, expected", [("LineItems", True), ("NonExistent", False)])
+def test_get_table_by_title(single_table_page, title, expected):
     """Test finding table by title."""
-    page = PageExtraction.create(page_number=1, tables=[sample_table])
-    
-    found = page.get_table_by_title("LineItems")
-    assert found is not None
-    assert found.title == "LineItems"
+    found = single_table_page.get_table_by_title(title)
     
-    not_found = page.get_table_by_title("NonExistent")
-    assert not_found is None
+    assert (found is not None) is expected
+    if expected:
+        assert found.title == title
 
 
 def test_low_confidence_count(sample_field, sample_field_low_conf, sample_table_low_conf):
@@ -280,9 +294,9 @@ def test_update_field(sample_field):
 def test_update_field_not_found():
     """Test updating non-existent field raises error."""
     page = PageExtraction.create(page_number=1)
-    field = FieldExtraction.create("test", "value", Confidence(0.9))
+    field = FieldExtraction.create("test", "value", _CONF_09)
     
-    with pytest.raises(ValueError, match="Field 'test' not found"):
+    with pytest.raises(ValueError, match=_ERR_FIELD_TEST_NOT_FOUND):
         page.update_field("test", field)
 
 
@@ -290,7 +304,7 @@ def test_update_table(sample_table):
     """Test updating an existing table."""
     page = PageExtraction.create(page_number=1, tables=[sample_table])
     
-    new_cell = TableCell(row=2, column=0, content="NewRow", confidence=Confidence(0.9))
+    new_cell = TableCell(row=2, column=0, content="NewRow", confidence=_CONF_09)
     updated_table = sample_table.add_cell(new_cell)
     new_page = page.update_table("LineItems", updated_table)
     
@@ -308,11 +322,11 @@ def test_update_table_not_found():
         id=uuid4(),
         cells=[],
         page_number=1,
-        confidence=Confidence(0.9),
+        confidence=_CONF_09,
         title="Test",
     )
     
-    with pytest.raises(ValueError, match="Table 'Test' not found"):
+    with pytest.raises(ValueError, match=_ERR_TABLE_TEST_NOT_FOUND):
         page.update_table("Test", table)
 
 
@@ -334,7 +348,7 @@ def test_add_duplicate_field(sample_field):
     
     duplicate = FieldExtraction.create("invoice_number", "other", confidence=0.9)
     
-    with pytest.raises(ValueError, match="Field 'invoice_number' already exists"):
+    with pytest.raises(ValueError, match=_ERR_DUPLICATE_FIELD):
         page.add_field(duplicate)
 
 
@@ -345,7 +359,7 @@ def test_add_table():
         id=uuid4(),
         cells=[],
         page_number=1,
-        confidence=Confidence(0.9),
+        confidence=_CONF_09,
         title="NewTable",
     )
     
@@ -364,11 +378,11 @@ def test_add_duplicate_table(sample_table):
         id=uuid4(),
         cells=[],
         page_number=1,
-        confidence=Confidence(0.9),
+        confidence=_CONF_09,
         title="LineItems",
     )
     
-    with pytest.raises(ValueError, match="Table 'LineItems' already exists"):
+    with pytest.raises(ValueError, match=_ERR_DUPLICATE_TABLE):
         page.add_table(duplicate)
 
 
@@ -389,7 +403,7 @@ def test_remove_field_not_found():
     """Test removing non-existent field raises error."""
     page = PageExtraction.create(page_number=1)
     
-    with pytest.raises(ValueError, match="Field 'nonexistent' not found"):
+    with pytest.raises(ValueError, match=_ERR_FIELD_NONEXISTENT_NOT_FOUND):
         page.remove_field("nonexistent")
 
 
@@ -399,7 +413,7 @@ def test_remove_table(sample_table):
         id=uuid4(),
         cells=[],
         page_number=1,
-        confidence=Confidence(0.9),
+        confidence=_CONF_09,
         title="Other",
     )
     page = PageExtraction.create(page_number=1, tables=[sample_table, table2])
@@ -416,7 +430,7 @@ def test_remove_table_not_found():
     """Test removing non-existent table raises error."""
     page = PageExtraction.create(page_number=1)
     
-    with pytest.raises(ValueError, match="Table 'NonExistent' not found"):
+    with pytest.raises(ValueError, match=_ERR_TABLE_NONEXISTENT_NOT_FOUND):
         page.remove_table("NonExistent")
 
 
@@ -431,6 +445,7 @@ def test_mark_reviewed():
 
 # ==================== Serialization Tests ====================
 
+@pytest.mark.serialization
 def test_to_dict(sample_field, sample_table):
     """Test conversion to dictionary."""
     page = PageExtraction.create(
@@ -452,6 +467,7 @@ def test_to_dict(sample_field, sample_table):
     assert "low_confidence_count" in data
 
 
+@pytest.mark.serialization
 def test_from_dict(sample_field, sample_table):
     """Test creation from dictionary."""
     page = PageExtraction.create(
@@ -470,6 +486,7 @@ def test_from_dict(sample_field, sample_table):
     assert restored.image_path == page.image_path
 
 
+@pytest.mark.serialization
 def test_serialization_roundtrip(sample_field, sample_table):
     """Test serialization and deserialization preserve data."""
     original = PageExtraction.create(
@@ -495,8 +512,5 @@ def test_repr():
     """Test string representation."""
     page = PageExtraction.create(page_number=7)
     
-    repr_str = repr(page)
-    assert "page=7" in repr_str
-    assert "fields=0" in repr_str
-    assert "tables=0" in repr_str
-    assert "confidence=" in repr_str
+    assert page._repr_fields == {"page": 7, "fields": 0, "tables": 0, "confidence": 1.0}
+    assert repr(page) == "PageExtraction(page=7, fields=0, tables=0, confidence=1.00)"
@@ -1,6 +1,8 @@
 """Unit tests for the CanonicalMapper domain service."""
 from __future__ import annotations
 
+from typing import Sequence
+
 import pytest
 
 from backend.domain.entities.field_extraction import FieldExtraction
@@ -11,7 +13,11 @@ from backend.domain.value_objects import CanonicalFieldIndex, CanonicalGroup
 from backend.domain.value_objects.confidence import Confidence
 
 
-@pytest.fixture()
+_CONF_09 = Confidence(0.9)
+
+
+# CanonicalMapper keeps no per-call state; map_document builds a new bundle each time.
+@pytest.fixture(scope="module")
 def mapper() -> CanonicalMapper:
     return CanonicalMapper(schema_version="test-1.0.0", confidence_override=0.9)
 
@@ -40,6 +46,22 @@ def make_field(
     )
 
 
+def make_fields(specs: Sequence[tuple[str, str, float, int]]) -> list[FieldExtraction]:
+    """Build fields from ``(name, value, confidence, page_number)`` rows."""
+    return [
+        make_field(name, value, confidence=confidence, page_number=page_number)
+        for name, value, confidence, page_number in specs
+    ]
+
+
+def make_cells(rows: Sequence[tuple[int, int, str, bool, Confidence]]) -> list[TableCell]:
+    """Build table cells from ``(row, column, content, is_header, confidence)`` rows."""
+    return [
+        TableCell(row=row, column=column, content=content, is_header=is_header, confidence=confidence)
+        for row, column, content, is_header, confidence in rows
+    ]
+
+
 def test_build_empty_bundle_includes_all_groups(mapper: CanonicalMapper) -> None:
     bundle = mapper.build_empty_bundle()
 
@@ -62,62 +84,82 @@ def test_build_empty_bundle_filters_groups(mapper: CanonicalMapper) -> None:
     assert bundle["documentCategories"] == ["INVOICE"]
 
 
-def test_map_document_populates_values_and_sources(mapper: CanonicalMapper) -> None:
-    invoice_number = make_field("invoice number", "INV-9087", confidence=0.82)
-    provider_name = make_field("provider name", "Evergreen Residence", confidence=0.88)
-    low_confidence = make_field("total amount", "1290.55", confidence=0.4)
+def test_build_empty_bundle_returns_fresh_entries(mapper: CanonicalMapper) -> None:
+    first = mapper.build_empty_bundle()
+    first["invoice"]["Invoice number"]["sources"].append({"page": 1})
 
-    page = PageExtraction.create(page_number=1, fields=[invoice_number, provider_name, low_confidence], tables=[])
+    second = mapper.build_empty_bundle()
 
-    bundle = mapper.map_document([page])
+    assert second["invoice"]["Invoice number"] == {"value": None, "confidence": None, "sources": []}
 
-    invoice_entry = bundle["invoice"]["Invoice number"]
+
+@pytest.fixture(scope="module")
+def invoice_page() -> PageExtraction:
+    """Single invoice page with number, provider and a low-confidence total."""
+    fields = make_fields(
+        (
+            ("invoice number", "INV-9087", 0.82, 1),
+            ("provider name", "Evergreen Residence", 0.88, 1),
+            ("total amount", "1290.55", 0.4, 1),
+        )
+    )
+    return PageExtraction.create(page_number=1, fields=fields, tables=[])
+
+
+@pytest.fixture(scope="module")
+def invoice_bundle(mapper: CanonicalMapper, invoice_page: PageExtraction) -> dict:
+    """Bundle mapped once from invoice_page; tests must only read it."""
+    return mapper.map_document([invoice_page])
+
+
+def test_invoice_number_value(invoice_bundle: dict, invoice_page: PageExtraction) -> None:
+    invoice_entry = invoice_bundle["invoice"]["Invoice number"]
     assert invoice_entry["value"] == "INV-9087"
     assert invoice_entry["confidence"] == pytest.approx(0.82)
     assert invoice_entry["sources"][0]["page"] == 1
-    assert invoice_entry["sources"][0]["fieldId"] == str(invoice_number.id)
+    assert invoice_entry["sources"][0]["fieldId"] == str(invoice_page.fields[0].id)
+
 
-    provider_entry = bundle["invoice"]["Provider name"]
+def test_provider_name_value(invoice_bundle: dict) -> None:
+    provider_entry = invoice_bundle["invoice"]["Provider name"]
     assert provider_entry["value"] == "Evergreen Residence"
 
-    amount_entry = bundle["invoice"]["Total amount"]
+
+def test_total_amount_low_conf(invoice_bundle: dict) -> None:
+    amount_entry = invoice_bundle["invoice"]["Total amount"]
     assert amount_entry["value"] == "1290.55"
     # Low confidence still stored because no competing higher confidence value
     assert amount_entry["confidence"] == pytest.approx(0.4)
 
-    source_map = bundle["sourceMap"].get("INVOICE_NUMBER")
+
+def test_source_map_invoice_number(invoice_bundle: dict) -> None:
+    source_map = invoice_bundle["sourceMap"].get("INVOICE_NUMBER")
     assert source_map is not None
     assert source_map["fieldIds"]
     assert source_map["pages"] == [1]
 
 
-def test_map_document_groups_invoice_line_items(mapper: CanonicalMapper) -> None:
-    description_one = make_field("Description / activity", "Monthly rent", confidence=0.81, page_number=1)
-    start_one = make_field("Start date", "2025-01-01", confidence=0.77, page_number=1)
-    end_one = make_field("End date", "2025-01-31", confidence=0.76, page_number=1)
-    amount_one = make_field("Charges / amount", "$3,200", confidence=0.8, page_number=1)
-
-    description_two = make_field("Description / activity", "Care services", confidence=0.79, page_number=1)
-    start_two = make_field("Start date", "2025-01-10", confidence=0.74, page_number=1)
-    quantity_two = make_field("Unit / quantity", "12", confidence=0.7, page_number=1)
-    credits_two = make_field("Credits", "$150", confidence=0.71, page_number=1)
-
-    page = PageExtraction.create(
-        page_number=1,
-        fields=[
-            description_one,
-            start_one,
-            end_one,
-            amount_one,
-            description_two,
-            start_two,
-            quantity_two,
-            credits_two,
-        ],
-        tables=[],
+@pytest.fixture(scope="module")
+def line_item_page() -> PageExtraction:
+    """Page with two general-invoice line items spread over eight fields."""
+    fields = make_fields(
+        (
+            ("Description / activity", "Monthly rent", 0.81, 1),
+            ("Start date", "2025-01-01", 0.77, 1),
+            ("End date", "2025-01-31", 0.76, 1),
+            ("Charges / amount", "$3,200", 0.8, 1),
+            ("Description / activity", "Care services", 0.79, 1),
+            ("Start date", "2025-01-10", 0.74, 1),
+            ("Unit / quantity", "12", 0.7, 1),
+            ("Credits", "$150", 0.71, 1),
+        )
     )
 
-    bundle = mapper.map_document([page])
+    return PageExtraction.create(page_number=1, fields=fields, tables=[])
+
+
+def test_map_document_groups_invoice_line_items(mapper: CanonicalMapper, line_item_page: PageExtraction) -> None:
+    bundle = mapper.map_document([line_item_page])
 
     assert "invoiceLineItems" in bundle
     line_items = bundle["invoiceLineItems"]
@@ -142,16 +184,16 @@ def test_map_document_groups_invoice_line_items(mapper: CanonicalMapper) -> None
 
 
 def test_map_document_aggregates_identity_blocks(mapper: CanonicalMapper) -> None:
-    policy_number = make_field("policy_number_duplicate", "POL-001")
-    policyholder_name = make_field("policyholder_name_duplicate", "Jane Doe")
-    patient_name = make_field("patient_name_duplicate", "Resident One")
-
-    page = PageExtraction.create(
-        page_number=2,
-        fields=[policy_number, policyholder_name, patient_name],
-        tables=[],
+    fields = make_fields(
+        (
+            ("policy_number_duplicate", "POL-001", 0.95, 1),
+            ("policyholder_name_duplicate", "Jane Doe", 0.95, 1),
+            ("patient_name_duplicate", "Resident One", 0.95, 1),
+        )
     )
 
+    page = PageExtraction.create(page_number=2, fields=fields, tables=[])
+
     bundle = mapper.map_document([page])
 
     identity_blocks = bundle["identityBlocks"]
@@ -230,27 +272,25 @@ def test_map_document_normalizes_absence_details(mapper: CanonicalMapper) -> Non
 
 
 def test_map_document_extracts_line_items_from_tables(mapper: CanonicalMapper) -> None:
-    headers = [
-        TableCell(row=0, column=0, content="Revenue Code", is_header=True, confidence=Confidence(0.9)),
-        TableCell(row=0, column=1, content="Description", is_header=True, confidence=Confidence(0.9)),
-        TableCell(row=0, column=2, content="Units", is_header=True, confidence=Confidence(0.9)),
-        TableCell(row=0, column=3, content="Total Charge", is_header=True, confidence=Confidence(0.9)),
-    ]
-    row_one = [
-        TableCell(row=1, column=0, content="0100", confidence=Confidence(0.82)),
-        TableCell(row=1, column=1, content="Room and board", confidence=Confidence(0.8)),
-        TableCell(row=1, column=2, content="5", confidence=Confidence(0.78)),
-        TableCell(row=1, column=3, content="$1,000", confidence=Confidence(0.79)),
-    ]
-    row_two = [
-        TableCell(row=2, column=0, content="0120", confidence=Confidence(0.81)),
-        TableCell(row=2, column=1, content="Therapy", confidence=Confidence(0.8)),
-        TableCell(row=2, column=2, content="2", confidence=Confidence(0.77)),
-        TableCell(row=2, column=3, content="$400", confidence=Confidence(0.76)),
-    ]
+    cells = make_cells(
+        (
+            (0, 0, "Revenue Code", True, _CONF_09),
+            (0, 1, "Description", True, _CONF_09),
+            (0, 2, "Units", True, _CONF_09),
+            (0, 3, "Total Charge", True, _CONF_09),
+            (1, 0, "0100", False, Confidence(0.82)),
+            (1, 1, "Room and board", False, Confidence(0.8)),
+            (1, 2, "5", False, Confidence(0.78)),
+            (1, 3, "$1,000", False, Confidence(0.79)),
+            (2, 0, "0120", False, Confidence(0.81)),
+            (2, 1, "Therapy", False, Confidence(0.8)),
+            (2, 2, "2", False, Confidence(0.77)),
+            (2, 3, "$400", False, Confidence(0.76)),
+        )
+    )
 
     table = TableExtraction.create(
-        cells=headers + row_one + row_two,
+        cells=cells,
         page_number=2,
         confidence=0.83,
         title="Line Items Table",
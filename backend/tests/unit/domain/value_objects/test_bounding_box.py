@@ -2,13 +2,6 @@
 Unit tests for BoundingBox value object
 """
 import pytest
-import sys
-from pathlib import Path
-
-# Add project root to Python path
-project_root = Path(__file__).resolve().parents[5]
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
 
 from backend.domain.value_objects.bounding_box import BoundingBox
 
@@ -2,122 +2,102 @@
 Unit tests for Confidence value object
 """
 import pytest
-import sys
-from pathlib import Path
-
-# Add project root to Python path
-project_root = Path(__file__).resolve().parents[5]
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
 
 from backend.domain.value_objects.confidence import Confidence
 
 
 class TestConfidenceCreation:
     """Test Confidence object creation and validation."""
-    
-    def test_valid_confidence(self):
-        """Test creating confidence with valid value."""
-        conf = Confidence(0.8)
-        assert conf.value == 0.8
-    
-    def test_zero_confidence(self):
-        """Test creating confidence with 0.0."""
-        conf = Confidence(0.0)
-        assert conf.value == 0.0
-    
-    def test_perfect_confidence(self):
-        """Test creating confidence with 1.0."""
-        conf = Confidence(1.0)
-        assert conf.value == 1.0
-    
-    def test_clamps_high_value(self):
-        """Test that values > 1.0 are clamped to 1.0."""
-        conf = Confidence(1.5)
-        assert conf.value == 1.0
-    
-    def test_clamps_negative_value(self):
-        """Test that negative values are clamped to 0.0."""
-        conf = Confidence(-0.5)
-        assert conf.value == 0.0
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            pytest.param(0.8, 0.8, id="valid"),
+            pytest.param(0.0, 0.0, id="zero"),
+            pytest.param(1.0, 1.0, id="perfect"),
+            pytest.param(1.5, 1.0, id="clamps_high"),
+            pytest.param(-0.5, 0.0, id="clamps_negative"),
+        ],
+    )
+    def test_value(self, raw, expected):
+        """Test values are kept within [0.0, 1.0]."""
+        assert Confidence(raw).value == expected
 
 
 class TestConfidenceFromRaw:
     """Test Confidence.from_raw() factory method."""
-    
-    def test_from_float(self):
-        """Test creating from float."""
-        conf = Confidence.from_raw(0.75)
-        assert conf.value == 0.75
-    
-    def test_from_string_valid(self):
-        """Test creating from valid string."""
-        conf = Confidence.from_raw("0.75")
-        assert conf.value == 0.75
-    
-    def test_from_string_invalid(self):
-        """Test creating from invalid string returns 0.0."""
-        conf = Confidence.from_raw("invalid")
-        assert conf.value == 0.0
-    
-    def test_from_none(self):
-        """Test creating from None returns 0.0."""
-        conf = Confidence.from_raw(None)
-        assert conf.value == 0.0
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            pytest.param(0.75, 0.75, id="float"),
+            pytest.param("0.75", 0.75, id="string_valid"),
+            pytest.param("invalid", 0.0, id="string_invalid"),
+            pytest.param(None, 0.0, id="none"),
+        ],
+    )
+    def test_from_raw(self, raw, expected):
+        """Test parsing raw values, falling back to 0.0 when unparseable."""
+        assert Confidence.from_raw(raw).value == expected
 
 
 class TestConfidenceThresholds:
     """Test confidence threshold methods."""
-    
-    def test_is_low_default_threshold(self):
-        """Test is_low() with default threshold (0.4)."""
-        assert Confidence(0.3).is_low()
-        assert Confidence(0.4).is_low()
-        assert not Confidence(0.5).is_low()
-    
-    def test_is_high_default_threshold(self):
-        """Test is_high() with default threshold (0.8)."""
-        assert not Confidence(0.7).is_high()
-        assert Confidence(0.8).is_high()
-        assert Confidence(0.9).is_high()
-    
-    def test_is_perfect(self):
-        """Test is_perfect() method."""
-        assert Confidence(1.0).is_perfect()
-        assert not Confidence(0.99).is_perfect()
-    
-    def test_is_zero(self):
-        """Test is_zero() method."""
-        assert Confidence(0.0).is_zero()
-        assert not Confidence(0.01).is_zero()
+
+    @pytest.mark.parametrize(
+        "method, value, expected",
+        [
+            # is_low() default threshold is 0.4 (inclusive)
+            ("is_low", 0.3, True),
+            ("is_low", 0.4, True),
+            ("is_low", 0.5, False),
+            # is_high() default threshold is 0.8 (inclusive)
+            ("is_high", 0.7, False),
+            ("is_high", 0.8, True),
+            ("is_high", 0.9, True),
+            ("is_perfect", 1.0, True),
+            ("is_perfect", 0.99, False),
+            ("is_zero", 0.0, True),
+            ("is_zero", 0.01, False),
+        ],
+    )
+    def test_threshold(self, method, value, expected):
+        """Test threshold predicates with their default bounds."""
+        assert getattr(Confidence(value), method)() is expected
 
 
 class TestConfidenceBuckets:
     """Test bucket_index() method for histograms."""
-    
-    def test_bucket_index_default_bounds(self):
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (0.1, 0),  # 0.0-0.2
+            (0.3, 1),  # 0.2-0.4
+            (0.5, 2),  # 0.4-0.6
+            (0.7, 3),  # 0.6-0.8
+            (0.9, 4),  # 0.8-1.0
+            (1.0, 4),  # exactly at boundary
+        ],
+    )
+    def test_bucket_index_default_bounds(self, value, expected):
         """Test bucket_index with default bounds."""
-        assert Confidence(0.1).bucket_index() == 0  # 0.0-0.2
-        assert Confidence(0.3).bucket_index() == 1  # 0.2-0.4
-        assert Confidence(0.5).bucket_index() == 2  # 0.4-0.6
-        assert Confidence(0.7).bucket_index() == 3  # 0.6-0.8
-        assert Confidence(0.9).bucket_index() == 4  # 0.8-1.0
-        assert Confidence(1.0).bucket_index() == 4  # exactly at boundary
+        assert Confidence(value).bucket_index() == expected
 
 
 class TestConfidenceHelpers:
     """Test helper methods."""
-    
-    def test_percentage(self):
+
+    @pytest.mark.parametrize("value, expected", [(0.75, 75.0), (1.0, 100.0)])
+    def test_percentage(self, value, expected):
         """Test percentage() method."""
-        assert Confidence(0.75).percentage() == 75.0
-        assert Confidence(1.0).percentage() == 100.0
-    
-    def test_str_representation(self):
+        assert Confidence(value).percentage() == expected
+
+    @pytest.mark.parametrize("value, expected", [(0.8, "0.80"), (1.0, "1.00")])
+    def test_str_representation(self, value, expected):
         """Test string representation."""
-        assert str(Confidence(0.8)) == "0.80"
-        assert str(Confidence(1.0)) == "1.00"
-    
+        assert str(Confidence(value)) == expected
+
     def test_float_conversion(self):
         """Test float conversion."""
         conf = Confidence(0.75)
@@ -126,26 +106,35 @@ class TestConfidenceHelpers:
 
 class TestConfidenceComparison:
     """Test comparison operators."""
-    
-    def test_less_than_confidence(self):
-        """Test < operator with another Confidence."""
-        assert Confidence(0.5) < Confidence(0.7)
-        assert not Confidence(0.7) < Confidence(0.5)
-    
-    def test_less_than_float(self):
-        """Test < operator with float."""
-        assert Confidence(0.5) < 0.7
-        assert not Confidence(0.7) < 0.5
-    
-    def test_greater_than(self):
+
+    @pytest.mark.parametrize(
+        "left, right, expected",
+        [
+            pytest.param(Confidence(0.5), Confidence(0.7), True, id="confidence"),
+            pytest.param(Confidence(0.7), Confidence(0.5), False, id="confidence_reversed"),
+            pytest.param(Confidence(0.5), 0.7, True, id="float"),
+            pytest.param(Confidence(0.7), 0.5, False, id="float_reversed"),
+        ],
+    )
+    def test_less_than(self, left, right, expected):
+        """Test < operator with Confidence and float operands."""
+        assert (left < right) is expected
+
+    @pytest.mark.parametrize(
+        "left, right, expected",
+        [
+            (Confidence(0.7), Confidence(0.5), True),
+            (Confidence(0.5), Confidence(0.7), False),
+        ],
+    )
+    def test_greater_than(self, left, right, expected):
         """Test > operator."""
-        assert Confidence(0.7) > Confidence(0.5)
-        assert not Confidence(0.5) > Confidence(0.7)
+        assert (left > right) is expected
 
 
 class TestConfidenceImmutability:
     """Test that Confidence is immutable."""
-    
+
     def test_cannot_modify_value(self):
         """Test that confidence value cannot be changed after creation."""
         conf = Confidence(0.5)
@@ -2,13 +2,6 @@
 Unit tests for JobStatus value object
 """
 import pytest
-import sys
-from pathlib import Path
-
-# Add project root to Python path
-project_root = Path(__file__).resolve().parents[5]
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
 
 from backend.domain.value_objects.job_status import JobState, JobStatus
 
@@ -84,48 +77,26 @@ class TestJobStatusProgressClamping:
         assert status.progress == 0.0
 
 
+TRANSITIONS = [
+    (JobState.QUEUED, JobState.RUNNING, True),
+    (JobState.QUEUED, JobState.CANCELLED, True),
+    (JobState.QUEUED, JobState.COMPLETED, False),  # must run first
+    (JobState.RUNNING, JobState.COMPLETED, True),
+    (JobState.RUNNING, JobState.ERROR, True),
+    (JobState.COMPLETED, JobState.RUNNING, False),  # terminal
+    (JobState.ERROR, JobState.RUNNING, True),  # retry
+    (JobState.PARTIAL, JobState.RUNNING, True),  # resume
+]
+
+
 class TestJobStatusTransitions:
     """Test state transition validation."""
     
-    def test_can_transition_queued_to_running(self):
-        """Test queued can transition to running."""
-        status = JobStatus.queued()
-        assert status.can_transition_to(JobState.RUNNING)
-    
-    def test_can_transition_queued_to_cancelled(self):
-        """Test queued can transition to cancelled."""
-        status = JobStatus.queued()
-        assert status.can_transition_to(JobState.CANCELLED)
-    
-    def test_cannot_transition_queued_to_completed(self):
-        """Test queued cannot directly transition to completed."""
-        status = JobStatus.queued()
-        assert not status.can_transition_to(JobState.COMPLETED)
-    
-    def test_can_transition_running_to_completed(self):
-        """Test running can transition to completed."""
-        status = JobStatus.running()
-        assert status.can_transition_to(JobState.COMPLETED)
-    
-    def test_can_transition_running_to_error(self):
-        """Test running can transition to error."""
-        status = JobStatus.running()
-        assert status.can_transition_to(JobState.ERROR)
-    
-    def test_cannot_transition_completed_to_running(self):
-        """Test completed is terminal (cannot transition to running)."""
-        status = JobStatus.completed()
-        assert not status.can_transition_to(JobState.RUNNING)
-    
-    def test_can_transition_error_to_running(self):
-        """Test error can transition to running (retry)."""
-        status = JobStatus.error("Failed")
-        assert status.can_transition_to(JobState.RUNNING)
-    
-    def test_can_transition_partial_to_running(self):
-        """Test partial can transition to running (resume)."""
-        status = JobStatus.partial()
-        assert status.can_transition_to(JobState.RUNNING)
+    @pytest.mark.parametrize("from_state, to_state, allowed", TRANSITIONS)
+    def test_can_transition_to(self, from_state, to_state, allowed):
+        """Test can_transition_to against the transition matrix."""
+        status = JobStatus(state=from_state)
+        assert status.can_transition_to(to_state) is allowed
 
 
 class TestJobStatusTransitionTo:
@@ -0,0 +1,103 @@
+"""Shared fixtures for mapping infrastructure tests."""
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+from backend.domain.entities.field_extraction import FieldExtraction
+from backend.domain.entities.job import Job
+from backend.domain.entities.page_extraction import PageExtraction
+from backend.domain.services.canonical_mapper import CanonicalMapper
+from backend.infrastructure.mapping.azure_mapping_client import AzureMappingClient
+from backend.infrastructure.mapping.canonical_transformer import CanonicalTransformer
+from backend.infrastructure.mapping.prompt_builder import CanonicalPromptBuilder
+
+
+class _DummyChatCompletions:
+    def __init__(self, response_json: Dict[str, Any], *, parsed: Optional[Dict[str, Any]] = None, as_content_list: bool = False) -> None:
+        self._payload_str = json.dumps(response_json)
+        self._parsed = parsed
+        self._as_content_list = as_content_list
+        self.last_kwargs: Optional[Dict[str, Any]] = None
+
+    def create(self, **kwargs: Any) -> Any:
+        self.last_kwargs = kwargs
+        payload = self._payload_str
+        content: Any
+        if self._as_content_list:
+            content = [
+                SimpleNamespace(type="text", text=payload)
+            ]
+        else:
+            content = payload
+        message = SimpleNamespace(content=content, parsed=self._parsed)
+        choice = SimpleNamespace(message=message)
+        return SimpleNamespace(choices=[choice])
+
+
+class _DummyChat:
+    def __init__(self, completions: _DummyChatCompletions) -> None:
+        self.completions = completions
+
+
+class _DummyOpenAI:
+    def __init__(self, response_json: Dict[str, Any], *, parsed: Optional[Dict[str, Any]] = None, as_content_list: bool = False) -> None:
+        self._completions = _DummyChatCompletions(response_json=response_json, parsed=parsed, as_content_list=as_content_list)
+        self.chat = _DummyChat(self._completions)
+
+    @property
+    def completions(self) -> _DummyChatCompletions:
+        return self._completions
+
+
+@pytest.fixture(scope="session")
+def base_job() -> tuple[Job, FieldExtraction]:
+    """Job with a single page holding one policy number field.
+
+    Session-scoped: ``generate`` only reads the job, and Job/PageExtraction
+    are frozen.
+    """
+    job = Job.create(job_id="job-001", filename="test.pdf")
+    field = FieldExtraction.create(
+        field_name="policy number",
+        value="PN-001",
+        confidence=0.92,
+        page_number=1,
+    )
+    page = PageExtraction.create(page_number=1, fields=[field], tables=[])
+    return job.with_pages([page]), field
+
+
+@pytest.fixture(scope="session")
+def mapping_collaborators() -> Dict[str, Any]:
+    """Transformer, prompt builder and mapper shared by every client under test.
+
+    All three are stateless between calls, so one set serves the session.
+    """
+    return {
+        "transformer": CanonicalTransformer(),
+        "prompt_builder": CanonicalPromptBuilder(),
+        "mapper": CanonicalMapper(),
+    }
+
+
+@pytest.fixture(scope="session")
+def make_azure_client(mapping_collaborators) -> Callable[..., tuple[AzureMappingClient, _DummyOpenAI]]:
+    """Build an AzureMappingClient backed by a fake OpenAI answering with ``payload``.
+
+    Returns ``(azure_client, fake_openai)``; a new fake is built per call, so
+    recorded request kwargs stay per test.
+    """
+    def _make(
+        payload: Dict[str, Any],
+        *,
+        parsed: Optional[Dict[str, Any]] = None,
+        as_content_list: bool = False,
+    ) -> tuple[AzureMappingClient, _DummyOpenAI]:
+        fake_openai = _DummyOpenAI(payload, parsed=parsed, as_content_list=as_content_list)
+        return AzureMappingClient(client=fake_openai, **mapping_collaborators), fake_openai
+
+    return _make
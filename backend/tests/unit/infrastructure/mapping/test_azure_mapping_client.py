@@ -1,93 +1,43 @@
 """Tests for AzureMappingClient integrations."""
 from __future__ import annotations
 
-from types import SimpleNamespace
-from typing import Any, Dict, List, Optional
-
-from backend.domain.entities.field_extraction import FieldExtraction
-from backend.domain.entities.job import Job
-from backend.domain.entities.page_extraction import PageExtraction
-from backend.infrastructure.mapping.azure_mapping_client import (
-    AzureMappingClient,
-)
-
-
-class _DummyChatCompletions:
-    def __init__(self, response_json: Dict[str, Any], *, parsed: Optional[Dict[str, Any]] = None, as_content_list: bool = False) -> None:
-        self._response_json = response_json
-        self._parsed = parsed
-        self._as_content_list = as_content_list
-        self.last_kwargs: Optional[Dict[str, Any]] = None
-
-    def create(self, **kwargs: Any) -> Any:
-        self.last_kwargs = kwargs
-        payload = self._response_json_json()
-        content: Any
-        if self._as_content_list:
-            content = [
-                SimpleNamespace(type="text", text=payload)
-            ]
-        else:
-            content = payload
-        message = SimpleNamespace(content=content, parsed=self._parsed)
-        choice = SimpleNamespace(message=message)
-        return SimpleNamespace(choices=[choice])
-
-    def _response_json_json(self) -> str:
-        import json
-
-        return json.dumps(self._response_json)
-
-
-class _DummyChat:
-    def __init__(self, completions: _DummyChatCompletions) -> None:
-        self.completions = completions
-
-
-class _DummyOpenAI:
-    def __init__(self, response_json: Dict[str, Any], *, parsed: Optional[Dict[str, Any]] = None, as_content_list: bool = False) -> None:
-        self._completions = _DummyChatCompletions(response_json=response_json, parsed=parsed, as_content_list=as_content_list)
-        self.chat = _DummyChat(self._completions)
+from typing import Any, Dict, List
 
-    @property
-    def completions(self) -> _DummyChatCompletions:
-        return self._completions
+import pytest
 
 
-def _make_job() -> tuple[Job, FieldExtraction]:
-    job = Job.create(job_id="job-001", filename="test.pdf")
-    field = FieldExtraction.create(
-        field_name="policy number",
-        value="PN-001",
-        confidence=0.92,
-        page_number=1,
-    )
-    page = PageExtraction.create(page_number=1, fields=[field], tables=[])
-    return job.with_pages([page]), field
-
-
-def test_generate_uses_deterministic_skeleton_and_merges_values() -> None:
-    dummy_response = {
+def _llm_response(value: str, confidence: float) -> Dict[str, Any]:
+    return {
         "documentTypes": ["facility_invoice"],
         "invoice": {
             "Policy number": {
-                "value": "PN-LLM",
-                "confidence": 0.3,
+                "value": value,
+                "confidence": confidence,
                 "sources": [{"fieldId": "llm"}],
             }
         },
-        "reasoningNotes": ["LLM attempted overwrite"],
     }
-    dummy_client = _DummyOpenAI(response_json=dummy_response)
-    azure_client = AzureMappingClient(client=dummy_client)
 
-    job, field = _make_job()
-    metadata = {
-        "documentCategories": ["facility_invoice"],
-        "pageCategories": {1: "facility_invoice"},
-    }
 
-    result = azure_client.generate(job, metadata=metadata)
+# Shared, read-only inputs: generate() serializes the response and only reads metadata.
+_RESPONSE_MERGE = {
+    **_llm_response("PN-LLM", 0.3),
+    "reasoningNotes": ["LLM attempted overwrite"],
+}
+_RESPONSE_TEXT = _llm_response("PN-Text", 0.3)
+_RESPONSE_PARSED = _llm_response("PN-Parsed", 0.5)
+_RESPONSE_LIST = _llm_response("PN-List", 0.4)
+_METADATA = {
+    "documentCategories": ["facility_invoice"],
+    "pageCategories": {1: "facility_invoice"},
+}
+
+
+def test_generate_uses_deterministic_skeleton_and_merges_values(base_job, make_azure_client) -> None:
+    azure_client, dummy_client = make_azure_client(_RESPONSE_MERGE)
+
+    job, field = base_job
+    result = azure_client.generate(job, metadata=_METADATA)
 
     policy_entry = result.canonical["invoice"]["Policy number"]
     assert policy_entry["value"] == "PN-001"
@@ -107,47 +57,22 @@ def test_generate_uses_deterministic_skeleton_and_merges_values() -> None:
     assert result.trace["prompt"]["pageCategories"] == {1: "facility_invoice"}
 
 
-def test_generate_supports_parsed_payload() -> None:
-    dummy_response = {
-        "documentTypes": ["facility_invoice"],
-        "invoice": {
-            "Policy number": {
-                "value": "PN-Parsed",
-                "confidence": 0.5,
-                "sources": [{"fieldId": "llm"}],
-            }
-        },
-    }
-
-    dummy_client = _DummyOpenAI(response_json=dummy_response, parsed=dummy_response)
-    azure_client = AzureMappingClient(client=dummy_client)
-
-    job, _ = _make_job()
-    result = azure_client.generate(job)
-
-    sources = result.canonical["invoice"]["Policy number"].get("sources", [])
-    assert any(source.get("fieldId") == "llm" for source in sources)
-    assert "PN-Parsed" in result.trace["response"]
-
-
-def test_generate_handles_list_content_payload() -> None:
-    dummy_response = {
-        "documentTypes": ["facility_invoice"],
-        "invoice": {
-            "Policy number": {
-                "value": "PN-List",
-                "confidence": 0.4,
-                "sources": [{"fieldId": "llm"}],
-            }
-        },
-    }
-
-    dummy_client = _DummyOpenAI(response_json=dummy_response, as_content_list=True)
-    azure_client = AzureMappingClient(client=dummy_client)
+@pytest.mark.parametrize(
+    "response, client_kwargs, expected_value",
+    [
+        pytest.param(_RESPONSE_TEXT, {}, "PN-Text", id="text_content"),
+        pytest.param(_RESPONSE_PARSED, {"parsed": _RESPONSE_PARSED}, "PN-Parsed", id="parsed"),
+        pytest.param(_RESPONSE_LIST, {"as_content_list": True}, "PN-List", id="content_list"),
+    ],
+)
+def test_generate_payload_shapes(base_job, make_azure_client, response, client_kwargs, expected_value) -> None:
+    azure_client, _ = make_azure_client(response, **client_kwargs)
 
-    job, _ = _make_job()
+    job, field = base_job
     result = azure_client.generate(job)
 
-    sources = result.canonical["invoice"]["Policy number"].get("sources", [])
+    policy_entry = result.canonical["invoice"]["Policy number"]
+    assert policy_entry["value"] == field.value
+    sources = policy_entry.get("sources", [])
     assert any(source.get("fieldId") == "llm" for source in sources)
-    assert "PN-List" in result.trace["response"]
\ No newline at end of file
+    assert expected_value in result.trace["response"]
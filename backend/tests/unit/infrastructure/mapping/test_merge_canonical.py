@@ -1,6 +1,4 @@
 """Tests for canonical bundle merge utility."""
-from collections import OrderedDict
-
 from backend.infrastructure.mapping.azure_mapping_client import merge_canonical_bundles
 
 
@@ -9,25 +7,21 @@ def test_merge_canonical_bundles_preserves_deterministic_values() -> None:
         "schemaVersion": "1.0.0",
         "generatedAt": "2025-01-01T00:00:00Z",
         "documentCategories": ["INVOICE"],
-        "invoice": OrderedDict(
-            {
-                "Invoice number": {
-                    "value": "INV-123",
-                    "confidence": 0.95,
-                    "sources": [{"fieldId": "f1"}],
-                }
+        "invoice": {
+            "Invoice number": {
+                "value": "INV-123",
+                "confidence": 0.95,
+                "sources": [{"fieldId": "f1"}],
             }
-        ),
-        "cmr": OrderedDict(
-            {
-                "Policy number": {
-                    "value": None,
-                    "confidence": None,
-                    "sources": [],
-                }
+        },
+        "cmr": {
+            "Policy number": {
+                "value": None,
+                "confidence": None,
+                "sources": [],
             }
-        ),
-        "ub04": OrderedDict(),
+        },
+        "ub04": {},
         "identityBlocks": [],
         "reasoningNotes": [],
         "sourceMap": {},
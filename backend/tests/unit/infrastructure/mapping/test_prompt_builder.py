@@ -1,10 +1,16 @@
 """Tests for the canonical prompt builder."""
+import pytest
+
 from backend.infrastructure.mapping.prompt_builder import CanonicalPromptBuilder
 
 
-def test_prompt_builder_includes_descriptions_and_categories() -> None:
-    builder = CanonicalPromptBuilder(schema_version="test-version")
+@pytest.fixture(scope="module")
+def builder() -> CanonicalPromptBuilder:
+    # The builder only stores its schema version, so one instance serves every test.
+    return CanonicalPromptBuilder(schema_version="test-version")
+
 
+def test_prompt_builder_includes_descriptions_and_categories(builder: CanonicalPromptBuilder) -> None:
     bundle = builder.build(
         document_categories=["facility_invoice", "ub04"],
         page_categories={1: "facility_invoice", 2: "ub04"},
@@ -22,9 +28,7 @@ def test_prompt_builder_includes_descriptions_and_categories() -> None:
     assert "identity block objects" in bundle.output_schema
 
 
-def test_prompt_builder_defaults_to_all_groups_when_unknown() -> None:
-    builder = CanonicalPromptBuilder(schema_version="test-version")
-
+def test_prompt_builder_defaults_to_all_groups_when_unknown(builder: CanonicalPromptBuilder) -> None:
     bundle = builder.build(document_categories=[], page_categories={})
 
     assert "General Invoice" in bundle.schema_summary
@@ -1,6 +1,7 @@
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import fitz  # type: ignore
 import pytest
 
 from backend.infrastructure.pdf.pdf_renderer import PdfRenderer, RenderedPage
@@ -63,3 +64,17 @@ def test_render_raises_for_missing_file():
     renderer = PdfRenderer()
     with pytest.raises(FileNotFoundError):
         renderer.render("/nonexistent.pdf")
+
+
+def test_render_with_process_pool_keeps_page_order(tmp_path):
+    pdf_path = tmp_path / "three-pages.pdf"
+    with fitz.open() as document:
+        for _ in range(3):
+            document.new_page(width=72, height=72)
+        document.save(pdf_path)
+
+    with patch("backend.infrastructure.pdf.pdf_renderer.auto_orient_image", return_value=0):
+        pages = PdfRenderer(zoom=1.0, max_workers=2).render(pdf_path, tmp_path / "output")
+
+    assert [page.page_number for page in pages] == [1, 2, 3]
+    assert all(page.image_path.exists() for page in pages)
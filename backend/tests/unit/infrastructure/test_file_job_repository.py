@@ -2,10 +2,7 @@
 
 import json
 import pytest
-import tempfile
-import shutil
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
 
 from backend.domain.entities.job import Job
 from backend.domain.entities.page_extraction import PageExtraction
@@ -41,15 +38,8 @@ class TestFileJobRepository:
     """Test suite for the aggregate-based FileJobRepository."""
 
     @pytest.fixture
-    def temp_dir(self):
-        temp_path = Path(tempfile.mkdtemp())
-        yield str(temp_path)
-        if temp_path.exists():
-            shutil.rmtree(temp_path)
-
-    @pytest.fixture
-    def repository(self, temp_dir):
-        return FileJobRepository(base_dir=temp_dir)
+    def repository(self, tmp_path):
+        return FileJobRepository(base_dir=str(tmp_path))
 
     def test_save_and_find_by_id_roundtrip(self, repository):
         job = make_job(
@@ -71,7 +61,7 @@ class TestFileJobRepository:
         assert len(loaded.pages) == 2
         assert loaded.source_path == "/data/document.pdf"
 
-    def test_save_persists_snapshot_file(self, repository, temp_dir):
+    def test_save_persists_snapshot_file(self, repository, tmp_path):
         job = make_job(
             job_id="job-save",
             filename="save.pdf",
@@ -81,7 +71,7 @@ class TestFileJobRepository:
 
         repository.save(job)
 
-        snapshot_path = Path(temp_dir) / "job-save" / "job_snapshot.json"
+        snapshot_path = tmp_path / "job-save" / "job_snapshot.json"
         assert snapshot_path.exists()
         payload = json.loads(snapshot_path.read_text())
         assert payload["filename"] == "save.pdf"
@@ -104,6 +94,27 @@ class TestFileJobRepository:
         assert loaded.status.state is JobState.ERROR
         assert loaded.status.error_message == "boom"
 
+    def test_durable_save_leaves_no_temp_files(self, tmp_path):
+        repository = FileJobRepository(base_dir=str(tmp_path), durable=True)
+        repository.save(make_job("job-durable", "durable.pdf", JobStatus.queued(), datetime(2024, 1, 1), total_pages=2))
+
+        job_dir = tmp_path / "job-durable"
+        assert not list(job_dir.rglob("*.tmp"))
+        assert repository.find_by_id("job-durable") is not None
+
+    def test_save_skips_files_whose_content_is_unchanged(self, repository, tmp_path):
+        job = make_job("job-same", "same.pdf", JobStatus.queued(), datetime(2024, 1, 1), total_pages=2)
+        repository.save(job)
+        pages_dir = tmp_path / "job-same" / "pages"
+        before = {path.name: path.stat().st_ino for path in pages_dir.iterdir()}
+
+        repository.save(job.update_page(2, job.get_page(2).mark_reviewed()))
+
+        after = {path.name: path.stat().st_ino for path in pages_dir.iterdir()}
+        assert after["page-1.json"] == before["page-1.json"]
+        assert after["page-2.json"] != before["page-2.json"]
+        assert repository.find_by_id("job-same").get_page(2).has_edits is True
+
     def test_find_by_id_returns_none_when_missing(self, repository):
         assert repository.find_by_id("unknown") is None
 
@@ -119,7 +130,7 @@ class TestFileJobRepository:
         assert repository.exists("job-exists") is True
         assert repository.exists("other") is False
 
-    def test_delete_removes_snapshot(self, repository, temp_dir):
+    def test_delete_removes_snapshot(self, repository, tmp_path):
         job = make_job(
             job_id="job-delete",
             filename="delete.pdf",
@@ -129,7 +140,7 @@ class TestFileJobRepository:
         repository.save(job)
 
         assert repository.delete("job-delete") is True
-        assert not (Path(temp_dir) / "job-delete").exists()
+        assert not (tmp_path / "job-delete").exists()
 
     def test_delete_returns_false_when_missing(self, repository):
         assert repository.delete("unknown") is False
@@ -170,6 +181,18 @@ class TestFileJobRepository:
         # Offset=1 means we skip newest (job-4)
         assert [job.job_id for job in page] == ["job-3", "job-2"]
 
+    def test_find_all_parallel_and_serial_loads_agree(self, tmp_path):
+        base_time = datetime(2024, 1, 1)
+        writer = FileJobRepository(base_dir=str(tmp_path))
+        for index in range(8):
+            writer.save(make_job(f"job-{index}", f"{index}.pdf", JobStatus.queued(), base_time + timedelta(minutes=index)))
+
+        serial = FileJobRepository(base_dir=str(tmp_path), max_workers=1).find_all()
+        parallel = FileJobRepository(base_dir=str(tmp_path), max_workers=4).find_all()
+
+        assert [job.job_id for job in parallel] == [job.job_id for job in serial]
+        assert [job.job_id for job in serial] == [f"job-{index}" for index in reversed(range(8))]
+
     def test_find_by_status_filters_and_orders(self, repository):
         base_time = datetime(2024, 1, 1)
         repository.save(make_job("done-1", "done1.pdf", JobStatus.completed(), base_time))
@@ -183,6 +206,18 @@ class TestFileJobRepository:
         assert len(paged) == 1
         assert paged[0].job_id == "done-1"
 
+    def test_count_by_status_tracks_snapshots_rewritten_elsewhere(self, repository, tmp_path):
+        repository.save(make_job("job-ext", "ext.pdf", JobStatus.queued(), datetime(2024, 1, 1)))
+        assert repository.count(status="queued") == 1
+
+        snapshot_path = tmp_path / "job-ext" / "job_snapshot.json"
+        payload = json.loads(snapshot_path.read_text())
+        payload["status"] = "completed"
+        snapshot_path.write_text(json.dumps(payload, indent=4), encoding="utf-8")
+
+        assert repository.count(status="queued") == 0
+        assert [job.job_id for job in repository.find_by_status("completed")] == ["job-ext"]
+
     def test_save_and_load_preserves_pages(self, repository):
         job = make_job(
             job_id="job-pages",
@@ -198,15 +233,90 @@ class TestFileJobRepository:
         assert len(loaded.pages) == 3
         assert [page.page_number for page in loaded.pages] == [1, 2, 3]
 
-    def test_find_by_id_raises_on_corrupted_snapshot(self, repository, temp_dir):
-        job_dir = Path(temp_dir) / "corrupt"
+    def test_find_by_id_raises_on_corrupted_snapshot(self, repository, tmp_path):
+        job_dir = tmp_path / "corrupt"
         job_dir.mkdir(parents=True)
         (job_dir / "job_snapshot.json").write_text("{not valid json", encoding="utf-8")
 
         with pytest.raises(RepositoryError):
             repository.find_by_id("corrupt")
 
-    def test_snapshot_contains_expected_structure(self, repository, temp_dir):
+    def test_find_by_id_raises_on_corrupted_page_file(self, repository, tmp_path):
+        repository.save(make_job("job-bad-page", "bad.pdf", JobStatus.queued(), datetime(2024, 1, 1)))
+        page_path = tmp_path / "job-bad-page" / "pages" / "page-1.json"
+        page_path.write_text("{not valid json", encoding="utf-8")
+
+        with pytest.raises(RepositoryError):
+            repository.find_by_id("job-bad-page")
+
+    def test_count_by_status_skips_jobs_with_unreadable_page_files(self, repository, tmp_path):
+        repository.save(make_job("job-bad-count", "bad.pdf", JobStatus.queued(), datetime(2024, 1, 1)))
+        (tmp_path / "job-bad-count" / "pages" / "page-1.json").write_text("{not valid", encoding="utf-8")
+        reader = FileJobRepository(base_dir=str(tmp_path))
+
+        assert reader.count(status="queued") == 0
+        assert reader.find_by_status("queued") == []
+        assert reader.find_all() == []
+        assert reader.count(status="queued") == 0
+
+    def test_find_by_status_pages_past_unreadable_jobs(self, repository, tmp_path):
+        for day in range(1, 5):
+            repository.save(make_job(f"job-{day}", "doc.pdf", JobStatus.queued(), datetime(2024, 1, day)))
+        (tmp_path / "job-4" / "pages" / "page-1.json").write_text("{not valid", encoding="utf-8")
+        reader = FileJobRepository(base_dir=str(tmp_path))
+
+        first = reader.find_by_status("queued", limit=2)
+        second = reader.find_by_status("queued", limit=2, offset=2)
+        assert [job.job_id for job in first] == ["job-3", "job-2"]
+        assert [job.job_id for job in second] == ["job-1"]
+        assert reader.count(status="queued") == 3
+
+    def test_save_writes_one_file_per_page(self, repository, tmp_path):
+        job = make_job("job-split", "split.pdf", JobStatus.queued(), datetime(2024, 1, 1), total_pages=2)
+        repository.save(job)
+
+        job_dir = tmp_path / "job-split"
+        snapshot = json.loads((job_dir / "job_snapshot.json").read_text())
+        assert snapshot["pages"] == [1, 2]
+        assert sorted(path.name for path in (job_dir / "pages").iterdir()) == ["page-1.json", "page-2.json"]
+
+        repository.save(job.remove_page(2))
+        assert not (job_dir / "pages" / "page-2.json").exists()
+
+    def test_find_by_id_reuses_cached_job_until_snapshot_changes(self, repository, tmp_path):
+        repository.save(make_job("job-cache", "cache.pdf", JobStatus.queued(), datetime(2024, 1, 1)))
+
+        first = repository.find_by_id("job-cache")
+        assert repository.find_by_id("job-cache") is first
+
+        snapshot_path = tmp_path / "job-cache" / "job_snapshot.json"
+        payload = json.loads(snapshot_path.read_text())
+        payload["filename"] = "renamed-elsewhere.pdf"
+        snapshot_path.write_text(json.dumps(payload), encoding="utf-8")
+
+        reloaded = repository.find_by_id("job-cache")
+        assert reloaded is not first
+        assert reloaded.filename == "renamed-elsewhere.pdf"
+
+    def test_save_page_file_replaces_embedded_page_entry(self, repository, tmp_path):
+        job_dir = tmp_path / "legacy-job"
+        job_dir.mkdir()
+        snapshot = {
+            "job_id": "legacy-job",
+            "filename": "legacy.pdf",
+            "status": "completed",
+            "created_at": "2024-01-01T00:00:00",
+            "pages": [{"page_number": 1}, {"page_number": 2}],
+        }
+        (job_dir / "job_snapshot.json").write_text(json.dumps(snapshot), encoding="utf-8")
+
+        repository.save_page_file("legacy-job", PageExtraction.create(page_number=2).mark_reviewed())
+
+        loaded = repository.find_by_id("legacy-job")
+        assert [page.page_number for page in loaded.pages] == [1, 2]
+        assert loaded.get_page(2).has_edits is True
+
+    def test_snapshot_contains_expected_structure(self, repository, tmp_path):
         job = make_job(
             job_id="job-structure",
             filename="structure.pdf",
@@ -215,7 +325,7 @@ class TestFileJobRepository:
         )
         repository.save(job)
 
-        snapshot_path = Path(temp_dir) / "job-structure" / "job_snapshot.json"
+        snapshot_path = tmp_path / "job-structure" / "job_snapshot.json"
         data = json.loads(snapshot_path.read_text())
         assert set(data.keys()) >= {"job_id", "filename", "status", "pages", "created_at"}
         assert isinstance(data["pages"], list)
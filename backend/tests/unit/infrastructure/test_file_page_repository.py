@@ -1,13 +1,11 @@
 """Unit tests for FilePageRepository working with domain entities."""
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 
 from backend.domain.entities.job import Job
 from backend.domain.entities.page_extraction import PageExtraction
 from backend.domain.exceptions import RepositoryError
+from backend.domain.repositories.job_repository import JobRepository
 from backend.infrastructure.persistence.file_job_repository import FileJobRepository
 from backend.infrastructure.persistence.file_page_repository import FilePageRepository
 
@@ -16,29 +14,60 @@ def make_job(job_id: str, filename: str) -> Job:
     return Job.create(job_id=job_id, filename=filename)
 
 
-class TestFilePageRepository:
-    """Test suite verifying page persistence via job aggregates."""
+class InMemoryJobRepository(JobRepository):
+    """Port implementation without page-level overrides."""
+
+    def __init__(self):
+        self.jobs = {}
+
+    def save(self, job):
+        self.jobs[job.job_id] = job
+
+    def find_by_id(self, job_id):
+        return self.jobs.get(job_id)
+
+    def find_all(self, limit=None, offset=0, sort_desc=True):
+        return list(self.jobs.values())
+
+    def find_by_status(self, status, limit=None, offset=0, sort_desc=True):
+        return [job for job in self.jobs.values() if job.status.state.value == status]
+
+    def delete(self, job_id):
+        return self.jobs.pop(job_id, None) is not None
+
+    def exists(self, job_id):
+        return job_id in self.jobs
+
+    def count(self, status=None):
+        return len(self.find_by_status(status) if status else self.jobs)
+
 
-    @pytest.fixture
-    def temp_dir(self):
-        temp_path = Path(tempfile.mkdtemp())
-        yield str(temp_path)
-        if temp_path.exists():
-            shutil.rmtree(temp_path)
+@pytest.fixture(scope="module")
+def job_repository(tmp_path_factory):
+    return FileJobRepository(base_dir=str(tmp_path_factory.mktemp("page-repository")))
 
-    @pytest.fixture
-    def job_repository(self, temp_dir):
-        return FileJobRepository(base_dir=temp_dir)
 
-    @pytest.fixture
-    def repository(self, job_repository):
-        return FilePageRepository(job_repository=job_repository)
+@pytest.fixture(scope="module")
+def repository(job_repository):
+    return FilePageRepository(job_repository=job_repository)
 
-    @pytest.fixture
-    def job_id(self, job_repository) -> str:
-        job = make_job("job-pages", "doc.pdf")
-        job_repository.save(job)
-        return job.job_id
+
+@pytest.fixture(scope="module")
+def job_id(job_repository) -> str:
+    """Job saved once per module; ``_reset_pages`` empties it after each test."""
+    job = make_job("job-pages", "doc.pdf")
+    job_repository.save(job)
+    return job.job_id
+
+
+@pytest.fixture(autouse=True)
+def _reset_pages(repository, job_id):
+    yield
+    repository.delete_all_pages(job_id)
+
+
+class TestFilePageRepository:
+    """Test suite verifying page persistence via job aggregates."""
 
     def test_save_page_adds_new_page(self, repository, job_repository, job_id):
         page = PageExtraction.create(page_number=1)
@@ -126,3 +155,18 @@ class TestFilePageRepository:
         repository.delete_page(job_id, 1)
         assert repository.count_pages(job_id) == 1
 
+
+def test_page_operations_fall_back_to_job_aggregates():
+    job_repository = InMemoryJobRepository()
+    job_repository.save(make_job("job-memory", "doc.pdf"))
+    repository = FilePageRepository(job_repository=job_repository)
+
+    repository.save_page("job-memory", PageExtraction.create(page_number=1))
+    repository.save_page("job-memory", PageExtraction.create(page_number=2))
+    assert repository.count_pages("job-memory") == 2
+    assert repository.delete_page("job-memory", 1) is True
+    assert repository.page_exists("job-memory", 1) is False
+    assert repository.page_exists("job-memory", 2) is True
+
+    with pytest.raises(RepositoryError):
+        repository.save_page("missing", PageExtraction.create(page_number=1))